@@ -3,9 +3,11 @@ import json
 import inspect
 import os
 import sys
-from typing import List, Dict, Any
+import tempfile
+import threading
+from typing import List, Dict, Any, Optional
 
-def parse_fastapi_file(file_path: str) -> List[Dict[str, Any]]:
+def parse_fastapi_file(file_path: str, server_port: int = 3020) -> List[Dict[str, Any]]:
     with open(file_path, "r") as source:
         tree = ast.parse(source.read())
 
@@ -176,7 +178,7 @@ def main():
         return
 
     print(f"Parsing {server_file}...")
-    endpoints = parse_fastapi_file(server_file)
+    endpoints = parse_fastapi_file(server_file, server_port)
     
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
@@ -186,6 +188,50 @@ def main():
     
     print(f"Generated {len(endpoints)} endpoints in {output_file}")
 
+# Serializes regeneration between the server's request threads
+_generate_lock = threading.Lock()
+
+def ensure_endpoints_file(config: Dict[str, Any], project_root: str, config_path: Optional[str] = None) -> str:
+    """
+    Returns the path of the endpoints file, regenerating it first when
+    autoGenerateEndpoints is set and the file is missing or older than the
+    server file or the config file (the curls embed app.port). Lets the
+    server parse endpoints on first use instead of at startup. Blocking:
+    call it from a worker thread in async code.
+    """
+    output_file = os.path.join(project_root, config.get("endpointsOutputFile", "config/endpoints.json"))
+    if not config.get("autoGenerateEndpoints", False):
+        return output_file
+
+    server_file = os.path.join(project_root, config.get("pythonServerFile", "./examples/sample_api.py"))
+    if not os.path.exists(server_file):
+        return output_file
+    with _generate_lock:
+        return _ensure_endpoints_file(config, server_file, output_file, config_path)
+
+def _ensure_endpoints_file(config, server_file, output_file, config_path):
+    sources = [server_file]
+    if config_path and os.path.exists(config_path):
+        sources.append(config_path)
+    if os.path.exists(output_file) and os.path.getmtime(output_file) >= max(os.path.getmtime(p) for p in sources):
+        return output_file
+
+    print(f"Parsing {server_file}...")
+    endpoints = parse_fastapi_file(server_file, config.get("app", {}).get("port", 3020))
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    # Write a temp file and swap it in, so concurrent readers never see a partial file
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(output_file), prefix=".endpoints-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(endpoints, f, indent=2)
+        os.chmod(temp_file, 0o644)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        os.unlink(temp_file)
+        raise
+    print(f"Generated {len(endpoints)} endpoints in {output_file}")
+    return output_file
+
 def main_entry():
     """Entry point for module execution"""
     main()
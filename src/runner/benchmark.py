@@ -0,0 +1,314 @@
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from statistics import median
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+from src.runner.fuzz import generate_cases, _build_url
+
+# A regression must be statistically significant AND at least this much slower
+DEFAULT_ALPHA = 0.01
+DEFAULT_MIN_SLOWDOWN = 0.05
+BOOTSTRAP_ITERATIONS = 2000
+
+
+def endpoint_key(endpoint: Dict[str, Any]) -> str:
+    return f"{endpoint['method']} {endpoint['path']}"
+
+
+async def collect_samples(
+    base_url: str,
+    endpoints: List[Dict[str, Any]],
+    runs: int = 30,
+    warmup: int = 5,
+    timeout: float = 30.0,
+    seed: Optional[int] = None,
+):
+    """
+    Times the example request of every endpoint `runs` times.
+    Requests are sent one at a time and interleaved: each round visits every
+    endpoint once in a shuffled order, so drift (GC, thermal, other load)
+    spreads evenly over endpoints instead of biasing whichever ran last.
+
+    Returns (samples, statuses): per endpoint, the latencies in ms and the
+    status code of each sample (None when the request got no response).
+    """
+    rng = random.Random(seed)
+    requests = []
+    for endpoint in endpoints:
+        case = generate_cases(endpoint)[0]
+        url, query = _build_url(base_url, endpoint, case["params"])
+        content = json.dumps(case["body"]) if case["body"] is not None else None
+        requests.append((endpoint_key(endpoint), endpoint["method"], url, query, content))
+
+    samples = {key: [] for key, *_ in requests}
+    statuses = {key: [] for key, *_ in requests}
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async def timed(method, url, query, content):
+            start = time.perf_counter()
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    params=query,
+                    content=content,
+                    headers={"Content-Type": "application/json"} if content is not None else None,
+                )
+                status = response.status_code
+            except httpx.HTTPError:
+                status = None
+            return (time.perf_counter() - start) * 1000, status
+
+        for _ in range(warmup):
+            for _, method, url, query, content in requests:
+                await timed(method, url, query, content)
+
+        order = list(requests)
+        for _ in range(runs):
+            rng.shuffle(order)
+            for key, method, url, query, content in order:
+                elapsed, status = await timed(method, url, query, content)
+                samples[key].append(elapsed)
+                statuses[key].append(status)
+
+    return samples, statuses
+
+
+def is_healthy(statuses: Optional[List[Optional[int]]]) -> bool:
+    """Whether every sample got a 2xx response (unknown statuses count as healthy)"""
+    return all(status is not None and 200 <= status < 300 for status in statuses or [])
+
+
+def status_counts(statuses: List[Optional[int]]) -> Dict[str, int]:
+    counts = {}
+    for status in statuses:
+        label = str(status) if status is not None else "error"
+        counts[label] = counts.get(label, 0) + 1
+    return counts
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that `current` tends to be larger than `baseline`.
+    Uses the normal approximation with tie and continuity correction; returns the p-value.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio_ci(current: List[float], baseline: List[float], confidence: float = 0.95, seed: int = 0):
+    """Percentile bootstrap confidence interval for median(current) / median(baseline)"""
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(BOOTSTRAP_ITERATIONS):
+        c = median(rng.choices(current, k=len(current)))
+        b = median(rng.choices(baseline, k=len(baseline)))
+        if b > 0:
+            ratios.append(c / b)
+    if not ratios:
+        return None, None
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (len(ratios) - 1))]
+    high = ratios[int((1 - tail) * (len(ratios) - 1))]
+    return low, high
+
+
+def compare(
+    current: Dict[str, List[float]],
+    baseline: Dict[str, List[float]],
+    alpha: float = DEFAULT_ALPHA,
+    min_slowdown: float = DEFAULT_MIN_SLOWDOWN,
+    current_statuses: Optional[Dict[str, List[Optional[int]]]] = None,
+    baseline_statuses: Optional[Dict[str, List[Optional[int]]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compares current samples against the baseline, one row per endpoint.
+    Endpoints with non-2xx or failed samples on either side are not timed
+    against each other: a fast error is not an improvement. They are
+    reported as "broken" (healthy in the baseline, failing now), "error"
+    (failing now) or "recovered" (failing only in the baseline).
+    """
+    current_statuses = current_statuses or {}
+    baseline_statuses = baseline_statuses or {}
+    rows = []
+    for key, samples in current.items():
+        base = baseline.get(key)
+        if not is_healthy(current_statuses.get(key)):
+            broken = bool(base) and is_healthy(baseline_statuses.get(key))
+            rows.append({
+                "endpoint": key,
+                "status": "broken" if broken else "error",
+                "median_ms": round(median(samples), 3) if samples else None,
+                "statuses": status_counts(current_statuses[key]),
+            })
+            continue
+        if base and not is_healthy(baseline_statuses.get(key)):
+            rows.append({"endpoint": key, "status": "recovered", "median_ms": round(median(samples), 3) if samples else None})
+            continue
+        if not base or not samples:
+            rows.append({"endpoint": key, "status": "new", "median_ms": round(median(samples), 3) if samples else None})
+            continue
+
+        ratio = median(samples) / median(base) if median(base) > 0 else float("inf")
+        p_value = mann_whitney_greater(samples, base)
+        ci_low, ci_high = bootstrap_ratio_ci(samples, base)
+
+        regressed = p_value < alpha and ratio > 1 + min_slowdown and ci_low is not None and ci_low > 1
+        improved = mann_whitney_greater(base, samples) < alpha and ratio < 1 - min_slowdown
+
+        rows.append({
+            "endpoint": key,
+            "status": "regression" if regressed else "improvement" if improved else "unchanged",
+            "baseline_median_ms": round(median(base), 3),
+            "median_ms": round(median(samples), 3),
+            "ratio": round(ratio, 3),
+            "ci": [round(ci_low, 3), round(ci_high, 3)] if ci_low is not None else None,
+            "p_value": round(p_value, 5),
+        })
+
+    for key in baseline:
+        if key not in current:
+            rows.append({"endpoint": key, "status": "missing"})
+    return rows
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, samples: Dict[str, List[float]], base_url: str, runs: int, statuses: Optional[Dict[str, List[Optional[int]]]] = None):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "url": base_url,
+            "runs": runs,
+            "samples": samples,
+            "statuses": statuses or {},
+        }, f, indent=2)
+
+
+def print_report(rows: List[Dict[str, Any]]):
+    print(f"{'Endpoint':45} {'Baseline':>10} {'Current':>10} {'Ratio':>7} {'95% CI':>15} {'p':>8}  Status")
+    for row in rows:
+        if "ratio" not in row:
+            statuses = ", ".join(f"{k}x{v}" for k, v in row["statuses"].items()) if "statuses" in row else ""
+            current = f"{row['median_ms']:>8.2f}ms" if row.get("median_ms") is not None else ""
+            print(f"{row['endpoint']:45} {'':>10} {current:>10} {'':>7} {'':>15} {'':>8}  {row['status']} {statuses}".rstrip())
+            continue
+        ci = f"{row['ci'][0]:.2f}-{row['ci'][1]:.2f}" if row["ci"] else "-"
+        print(
+            f"{row['endpoint']:45} {row['baseline_median_ms']:>8.2f}ms {row['median_ms']:>8.2f}ms "
+            f"{row['ratio']:>7.2f} {ci:>15} {row['p_value']:>8.4f}  {row['status']}"
+        )
+
+
+def main():
+    import argparse
+
+    from src.generator.endpoints import ensure_endpoints_file
+
+    PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    config_path = os.environ.get("API_TESTER_CONFIG", os.path.join(PROJECT_ROOT, "config.json"))
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    port = config.get("app", {}).get("port", 3020)
+
+    parser = argparse.ArgumentParser(description="Benchmark every endpoint and compare against a stored baseline")
+    parser.add_argument("--url", default=f"http://localhost:{port}", help="Base URL of the running wrapper")
+    parser.add_argument("--endpoints", help="Endpoints file (default: the configured one, regenerated if stale)")
+    parser.add_argument("--baseline", default=os.path.join(PROJECT_ROOT, config.get("benchmarkBaselineFile", "config/benchmark_baseline.json")))
+    parser.add_argument("--runs", type=int, default=30, help="Timed runs per endpoint")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed warmup runs per endpoint")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Significance level")
+    parser.add_argument("--min-slowdown", type=float, default=DEFAULT_MIN_SLOWDOWN, help="Smallest relative slowdown reported as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the interleaving order")
+    args = parser.parse_args()
+
+    # The server only generates endpoints on first use, so make sure they are current
+    if not args.endpoints:
+        # Generation logs to stdout; keep it out of --json output
+        with contextlib.redirect_stdout(sys.stderr):
+            args.endpoints = ensure_endpoints_file(config, PROJECT_ROOT, config_path)
+    if not os.path.exists(args.endpoints):
+        parser.error(f"endpoints file not found: {args.endpoints} (run python -m src.generator.endpoints)")
+
+    with open(args.endpoints, "r") as f:
+        endpoints = json.load(f)
+
+    print(f"Benchmarking {len(endpoints)} endpoints at {args.url} ({args.warmup} warmup, {args.runs} runs)...", file=sys.stderr)
+    samples, statuses = asyncio.run(collect_samples(args.url, endpoints, runs=args.runs, warmup=args.warmup, seed=args.seed))
+
+    failing = [key for key in samples if not is_healthy(statuses[key])]
+    if failing:
+        print(f"{len(failing)} endpoint(s) returned non-2xx or failed and are excluded from the comparison: {', '.join(failing)}", file=sys.stderr)
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None or args.save_baseline:
+        save_baseline(args.baseline, samples, args.url, args.runs, statuses)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        if baseline is None:
+            return
+
+    rows = compare(
+        samples, baseline["samples"], alpha=args.alpha, min_slowdown=args.min_slowdown,
+        current_statuses=statuses, baseline_statuses=baseline.get("statuses"),
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    broken = [row for row in rows if row["status"] == "broken"]
+    if regressions:
+        print(f"\n{len(regressions)} significant regression(s) against baseline from {baseline.get('created')}", file=sys.stderr)
+    if broken:
+        print(f"{len(broken)} endpoint(s) succeeded in the baseline but fail now", file=sys.stderr)
+    if regressions or broken:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+import asyncio
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+from statistics import median
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote
+
+import httpx
+
+# Boundary values per type name as emitted by src.generator.endpoints
+BOUNDARY_VALUES = {
+    "int": [0, -1, 1, 2**31 - 1, -(2**31), 2**63],
+    "float": [0.0, -1.0, 1e-308, 1.7976931348623157e308, -1.7976931348623157e308],
+    "bool": [True, False],
+    "str": ["", " ", "ünïcødé ✓", "'; DROP TABLE x; --", "\x00"],
+    "List": [[], [None]],
+    "list": [[], [None]],
+    "Dict": [{}, {"": None}],
+    "dict": [{}, {"": None}],
+}
+BOUNDARY_VALUES["Integer"] = BOUNDARY_VALUES["int"]
+BOUNDARY_VALUES["Float"] = BOUNDARY_VALUES["float"]
+BOUNDARY_VALUES["Boolean"] = BOUNDARY_VALUES["bool"]
+BOUNDARY_VALUES["string"] = BOUNDARY_VALUES["str"]
+
+# A value of the wrong type for each type name; the backend should reject it
+WRONG_TYPE_VALUES = {
+    "int": "not-a-number",
+    "Integer": "not-a-number",
+    "float": "not-a-number",
+    "Float": "not-a-number",
+    "bool": {"not": "a bool"},
+    "Boolean": {"not": "a bool"},
+    "str": {"not": "a string"},
+    "string": {"not": "a string"},
+    "List": "not-a-list",
+    "list": "not-a-list",
+    "Dict": "not-a-dict",
+    "dict": "not-a-dict",
+}
+
+# Approximate string length used to grow payloads for each size class
+DEFAULT_PAYLOAD_SIZES = {"small": 16, "medium": 16 * 1024, "large": 512 * 1024}
+# Query values stay well below the ~16 KB request-line limit of h11/uvicorn (and
+# httpx's own URL limit); only body fields grow to the larger size classes
+MAX_QUERY_VALUE_BYTES = 4 * 1024
+
+# Log-log slope above which latency is considered to grow super-linearly with size
+SUPERLINEAR_SLOPE = 1.2
+# Ignore scaling for endpoints whose largest class is still this fast (noise)
+SUPERLINEAR_MIN_MS = 5.0
+
+
+def _sample_value(type_name: str):
+    if type_name in ("int", "Integer"):
+        return 1
+    if type_name in ("float", "Float"):
+        return 1.0
+    if type_name in ("bool", "Boolean"):
+        return True
+    return "test"
+
+
+def _grow_value(type_name: str, size: int):
+    """Builds a value of roughly `size` serialized bytes, or None if the type cannot grow"""
+    if type_name in ("str", "string"):
+        return "x" * size
+    if type_name in ("List", "list"):
+        return ["x"] * max(1, size // 4)
+    if type_name in ("Dict", "dict"):
+        return {f"k{i}": i for i in range(max(1, size // 12))}
+    return None
+
+
+def generate_cases(endpoint: Dict[str, Any], payload_sizes: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Generates input variants for an endpoint from its generated schema.
+
+    Each case is a dict with:
+        name        -- human readable description
+        kind        -- "valid", "boundary", "optional", "invalid" or "size"
+        size_class  -- payload size class for "size" cases, otherwise "small"
+        params      -- {param name: value} for path and query parameters
+        body        -- JSON body or None
+        expect      -- "ok" (no server error) or "reject" (4xx)
+    """
+    payload_sizes = payload_sizes or DEFAULT_PAYLOAD_SIZES
+    params = endpoint.get("parameters") or []
+    body_spec = endpoint.get("body")
+    schema = (body_spec or {}).get("schema") or []
+
+    base_params = {p["name"]: _sample_value(p.get("type", "str")) for p in params}
+    if body_spec:
+        base_body = dict(body_spec.get("example") or {})
+    else:
+        base_body = None
+
+    def case(name, kind, params=None, body=None, expect="ok", size_class="small"):
+        return {
+            "name": name,
+            "kind": kind,
+            "size_class": size_class,
+            "params": base_params if params is None else params,
+            "body": base_body if body is None else body,
+            "expect": expect,
+        }
+
+    cases = [case("example", "valid")]
+
+    # Type boundaries, one parameter or field at a time
+    for p in params:
+        for value in BOUNDARY_VALUES.get(p.get("type", "str"), []):
+            if p.get("in") == "path" and value == "":
+                # An empty segment changes the route (/users/{name} -> /users/) rather than the input
+                continue
+            cases.append(case(f"param {p['name']}={value!r}", "boundary", params={**base_params, p["name"]: value}))
+
+    for field in schema:
+        for value in BOUNDARY_VALUES.get(field["type"], []):
+            cases.append(case(f"field {field['name']}={value!r}", "boundary", body={**base_body, field["name"]: value}))
+
+        wrong = WRONG_TYPE_VALUES.get(field["type"])
+        if wrong is not None:
+            cases.append(case(f"field {field['name']} wrong type", "invalid", body={**base_body, field["name"]: wrong}, expect="reject"))
+
+        without = {k: v for k, v in base_body.items() if k != field["name"]}
+        if field.get("required", True):
+            cases.append(case(f"missing required {field['name']}", "invalid", body=without, expect="reject"))
+        else:
+            cases.append(case(f"omit optional {field['name']}", "optional", body=without))
+
+    if body_spec and schema:
+        cases.append(case("all optional fields omitted", "optional",
+                          body={f["name"]: base_body.get(f["name"]) for f in schema if f.get("required", True)}))
+
+    # Payload size classes: grow every field (and str query param, capped) that can grow
+    query_sizes = set()
+    for size_class, size in sorted(payload_sizes.items(), key=lambda item: item[1]):
+        grown_body = dict(base_body) if base_body is not None else None
+        grown_params = dict(base_params)
+        body_grew = False
+        for field in schema:
+            value = _grow_value(field["type"], size)
+            if value is not None:
+                grown_body[field["name"]] = value
+                body_grew = True
+        query_size = min(size, MAX_QUERY_VALUE_BYTES)
+        query_grew = False
+        for p in params:
+            if p.get("in") == "query":
+                value = _grow_value(p.get("type", "str"), query_size)
+                if isinstance(value, str):
+                    grown_params[p["name"]] = value
+                    query_grew = True
+        # Without a body to grow, classes past the query cap would repeat the same request
+        if body_grew or (query_grew and query_size not in query_sizes):
+            query_sizes.add(query_size)
+            cases.append(case(f"{size_class} payload", "size", params=grown_params, body=grown_body, size_class=size_class))
+
+    return cases
+
+
+def _build_url(base_url: str, endpoint: Dict[str, Any], params: Dict[str, Any]):
+    path = endpoint["path"]
+    query = {}
+    for p in endpoint.get("parameters") or []:
+        value = params.get(p["name"])
+        if p.get("in") == "path":
+            path = path.replace(f"{{{p['name']}}}", quote(str(value), safe=""))
+        else:
+            query[p["name"]] = json.dumps(value) if isinstance(value, (list, dict, bool)) else value
+    return f"{base_url.rstrip('/')}{path}", query
+
+
+def _resolve_ref(schema: Dict[str, Any], openapi: Dict[str, Any]):
+    while isinstance(schema, dict) and "$ref" in schema:
+        node = openapi
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node.get(part, {})
+        schema = node
+    return schema or {}
+
+
+def _response_schema(openapi: Dict[str, Any], endpoint: Dict[str, Any], status: int):
+    operation = openapi.get("paths", {}).get(endpoint["path"], {}).get(endpoint["method"].lower())
+    if not operation:
+        return None
+    responses = operation.get("responses", {})
+    response = responses.get(str(status)) or responses.get("default")
+    if not response:
+        return None
+    schema = response.get("content", {}).get("application/json", {}).get("schema")
+    return _resolve_ref(schema, openapi) if schema else None
+
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+}
+
+
+def check_schema(data: Any, schema: Dict[str, Any], openapi: Dict[str, Any]) -> Optional[str]:
+    """Shallow OpenAPI schema check: top-level type and required properties. Returns an error or None"""
+    schema = _resolve_ref(schema, openapi)
+    expected = _JSON_TYPES.get(schema.get("type"))
+    if expected and not isinstance(data, expected):
+        return f"expected {schema['type']}, got {type(data).__name__}"
+    if isinstance(data, dict):
+        missing = [name for name in schema.get("required", []) if name not in data]
+        if missing:
+            return f"missing properties: {', '.join(missing)}"
+    return None
+
+
+async def _run_case(client: httpx.AsyncClient, base_url: str, endpoint, case, openapi, repeat: int):
+    url, query = _build_url(base_url, endpoint, case["params"])
+    body = case["body"]
+    content = json.dumps(body) if body is not None else None
+    timings = []
+    status = None
+    error = None
+    transport_error = False
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            response = await client.request(
+                endpoint["method"],
+                url,
+                params=query,
+                content=content,
+                headers={"Content-Type": "application/json"} if content is not None else None,
+            )
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            # The request never got a response: not a verdict on the app
+            error = f"{type(e).__name__}: {e}"
+            transport_error = True
+            break
+        timings.append((time.perf_counter() - start) * 1000)
+        status = response.status_code
+
+    passed = error is None
+    if passed and case["expect"] == "reject":
+        if not 400 <= status < 500:
+            passed, error = False, f"expected 4xx, got {status}"
+    elif passed:
+        if status >= 500:
+            passed, error = False, f"server error {status}"
+        elif 200 <= status < 300 and openapi:
+            schema = _response_schema(openapi, endpoint, status)
+            if schema and response.headers.get("content-type", "").startswith("application/json"):
+                error = check_schema(response.json(), schema, openapi)
+                passed = error is None
+
+    return {
+        "name": case["name"],
+        "kind": case["kind"],
+        "size_class": case["size_class"],
+        "payload_bytes": len(content or "") + len(str(query)),
+        "status": status,
+        "passed": passed,
+        "error": error,
+        "transport_error": transport_error,
+        "latency_ms": median(timings) if timings else None,
+    }
+
+
+def _scaling(results: List[Dict[str, Any]]):
+    """Log-log slope of latency versus payload size across size-class cases"""
+    sized = [r for r in results if r["kind"] == "size" and r["latency_ms"] and not r["transport_error"]]
+    if len(sized) < 2:
+        return None
+    sized.sort(key=lambda r: r["payload_bytes"])
+    smallest, largest = sized[0], sized[-1]
+    if largest["payload_bytes"] <= smallest["payload_bytes"]:
+        return None
+    slope = math.log(largest["latency_ms"] / smallest["latency_ms"]) / math.log(
+        largest["payload_bytes"] / smallest["payload_bytes"]
+    )
+    return {
+        "slope": round(slope, 3),
+        "superlinear": slope > SUPERLINEAR_SLOPE and largest["latency_ms"] >= SUPERLINEAR_MIN_MS,
+    }
+
+
+async def run_fuzz(
+    base_url: str,
+    endpoints: List[Dict[str, Any]],
+    concurrency: int = 8,
+    repeat: int = 3,
+    payload_sizes: Optional[Dict[str, int]] = None,
+    timeout: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Runs generated cases for every endpoint against base_url.
+    Endpoints run concurrently (bounded by `concurrency`); cases within an
+    endpoint run sequentially so their latencies do not interfere.
+    """
+    if concurrency < 1 or repeat < 1:
+        raise ValueError("concurrency and repeat must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        try:
+            openapi = (await client.get(f"{base_url.rstrip('/')}/openapi.json")).json()
+        except Exception:
+            openapi = None
+
+        async def run_endpoint(endpoint):
+            async with semaphore:
+                results = []
+                for case in generate_cases(endpoint, payload_sizes):
+                    # Size classes are what we measure, so repeat those; other cases run once
+                    runs = repeat if case["kind"] == "size" else 1
+                    results.append(await _run_case(client, base_url, endpoint, case, openapi, runs))
+
+            latency_by_size = {}
+            for r in results:
+                if r["kind"] == "size" and r["latency_ms"] is not None and not r["transport_error"]:
+                    latency_by_size[r["size_class"]] = round(r["latency_ms"], 3)
+
+            return {
+                "method": endpoint["method"],
+                "path": endpoint["path"],
+                "cases": results,
+                "passed": sum(1 for r in results if r["passed"]),
+                "failed": sum(1 for r in results if not r["passed"] and not r["transport_error"]),
+                "errors": sum(1 for r in results if r["transport_error"]),
+                "latency_by_size": latency_by_size,
+                "scaling": _scaling(results),
+            }
+
+        reports = await asyncio.gather(*(run_endpoint(ep) for ep in endpoints))
+
+    return {
+        "endpoints": reports,
+        "total": sum(r["passed"] + r["failed"] + r["errors"] for r in reports),
+        "passed": sum(r["passed"] for r in reports),
+        "failed": sum(r["failed"] for r in reports),
+        "errors": sum(r["errors"] for r in reports),
+        "superlinear": [f"{r['method']} {r['path']}" for r in reports if r["scaling"] and r["scaling"]["superlinear"]],
+    }
+
+
+def main():
+    import argparse
+
+    from src.generator.endpoints import ensure_endpoints_file
+
+    PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    config_path = os.environ.get("API_TESTER_CONFIG", os.path.join(PROJECT_ROOT, "config.json"))
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    port = config.get("app", {}).get("port", 3020)
+
+    parser = argparse.ArgumentParser(description="Fuzz every endpoint from its generated schema")
+    parser.add_argument("--url", default=f"http://localhost:{port}", help="Base URL of the running server")
+    parser.add_argument("--endpoints", help="Endpoints file (default: the configured one, regenerated if stale)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per payload size class")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args()
+    if args.concurrency < 1 or args.repeat < 1:
+        parser.error("--concurrency and --repeat must be at least 1")
+
+    # The server only generates endpoints on first use, so make sure they are current
+    if not args.endpoints:
+        # Generation logs to stdout; keep it out of --json output
+        with contextlib.redirect_stdout(sys.stderr):
+            args.endpoints = ensure_endpoints_file(config, PROJECT_ROOT, config_path)
+    if not os.path.exists(args.endpoints):
+        parser.error(f"endpoints file not found: {args.endpoints} (run python -m src.generator.endpoints)")
+
+    with open(args.endpoints, "r") as f:
+        endpoints = json.load(f)
+
+    report = asyncio.run(run_fuzz(args.url, endpoints, concurrency=args.concurrency, repeat=args.repeat))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for ep in report["endpoints"]:
+            sizes = ", ".join(f"{k}={v}ms" for k, v in ep["latency_by_size"].items())
+            errors = f", {ep['errors']} transport errors" if ep["errors"] else ""
+            print(f"{ep['method']:7} {ep['path']:40} {ep['passed']} passed, {ep['failed']} failed{errors}  {sizes}")
+            for case in ep["cases"]:
+                if case["transport_error"]:
+                    print(f"    ERROR {case['name']}: {case['error']}")
+                elif not case["passed"]:
+                    print(f"    FAIL {case['name']}: {case['error']}")
+        print(f"\n{report['passed']}/{report['total']} cases passed, {report['failed']} failed, {report['errors']} transport errors")
+        for name in report["superlinear"]:
+            print(f"Super-linear latency growth: {name}")
+
+    # 1: the app failed cases or scaled badly; 2: only the connection to it failed
+    if report["failed"] or report["superlinear"]:
+        sys.exit(1)
+    sys.exit(2 if report["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from statistics import mean
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAMPLE_APP = os.path.join(PROJECT_ROOT, "examples", "sample_api.py")
+
+SETUPS = ("bare", "wrapped", "proxy")
+DEFAULT_CONCURRENCY = (1, 8, 32)
+SYNTHETIC_ROUTES = 300
+# What start.sh serves: the lazy launcher in front of src.server.wrapper
+WRAPPED_ENTRYPOINT = "src.server.launcher:LazyWrapperApp"
+
+# Requests replayed against each app; "/" is moved to /api/root by the wrapper
+SAMPLE_SCENARIOS = [
+    {"name": "sample: GET /", "method": "GET", "path": "/"},
+    {"name": "sample: GET /items/{item_id}", "method": "GET", "path": "/items/1?q=bench"},
+    {"name": "sample: POST /items/", "method": "POST", "path": "/items/", "body": {"name": "Bench", "price": 1.5}},
+]
+SYNTHETIC_SCENARIOS = [
+    {"name": "synthetic: first route", "method": "GET", "path": "/resource0/1"},
+    {"name": "synthetic: last route", "method": "GET", "path": f"/resource{SYNTHETIC_ROUTES - 1}/1"},
+]
+
+
+def write_synthetic_app(directory: str, routes: int = SYNTHETIC_ROUTES) -> str:
+    """Writes a FastAPI app with `routes` parametrised GET routes and returns its path"""
+    lines = [
+        "from fastapi import FastAPI",
+        "",
+        'app = FastAPI(title="Synthetic Benchmark App")',
+        "",
+    ]
+    for i in range(routes):
+        lines += [
+            f'@app.get("/resource{i}/{{item_id}}")',
+            f"async def get_resource{i}(item_id: int, q: str = None):",
+            f'    return {{"resource": {i}, "item_id": item_id, "q": q}}',
+            "",
+        ]
+    path = os.path.join(directory, "synthetic_api.py")
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before becoming ready ({url})")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server did not become ready: {url}")
+
+
+def start_bare_server(app_file: str) -> Dict[str, Any]:
+    """Runs the user app on its own under uvicorn"""
+    port = _free_port()
+    module = os.path.basename(app_file)[:-len(".py")]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--app-dir", os.path.dirname(app_file),
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=os.path.dirname(app_file),
+        stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    _wait_ready(f"{base_url}/openapi.json", process)
+    return {"process": process, "url": base_url}
+
+
+def start_wrapped_server(app_file: str, work_dir: str) -> Dict[str, Any]:
+    """
+    Runs the user app the way start.sh does: src.server.launcher's
+    LazyWrapperApp in front of src.server.wrapper, using a throwaway config.
+    """
+    port = _free_port()
+    config_file = os.path.join(work_dir, f"config_{port}.json")
+    with open(config_file, "w") as f:
+        json.dump({
+            "app": {"host": "127.0.0.1", "port": port},
+            "pythonServerFile": app_file,
+            "endpointsOutputFile": os.path.join(work_dir, f"endpoints_{port}.json"),
+            "autoGenerateEndpoints": False,
+            "proxyCache": {"enabled": False},
+        }, f)
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--factory", WRAPPED_ENTRYPOINT,
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "API_TESTER_CONFIG": config_file},
+        stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    # /api/config is answered before the user app has loaded; /openapi.json waits for it
+    _wait_ready(f"{base_url}/openapi.json", process)
+    return {"process": process, "url": base_url}
+
+
+def stop_server(server: Dict[str, Any]):
+    process = server["process"]
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def build_request(setup: str, scenario: Dict[str, Any], bare_url: str, wrapped_url: str) -> Dict[str, Any]:
+    """
+    Turns a scenario into the concrete request for one setup.
+    The proxy setup goes through /api/proxy on the wrapper and targets the
+    wrapper itself, which is how the UI sends requests.
+    """
+    path = scenario["path"]
+    body = scenario.get("body")
+    if setup == "bare":
+        return {"method": scenario["method"], "url": bare_url + path, "body": body}
+
+    if path == "/" or path.startswith("/?"):
+        path = "/api/root" + path[1:]
+    if setup == "wrapped":
+        return {"method": scenario["method"], "url": wrapped_url + path, "body": body}
+
+    return {
+        "method": "POST",
+        "url": wrapped_url + "/api/proxy",
+        "body": {"method": scenario["method"], "url": wrapped_url + path, "headers": {}, "body": body},
+    }
+
+
+async def run_load(request: Dict[str, Any], concurrency: int, requests: int, warmup: int = 20, timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Closed-loop load: `concurrency` workers each send their next request as
+    soon as the previous one completes, until `requests` have been sent.
+    """
+    content = json.dumps(request["body"]) if request["body"] is not None else None
+    headers = {"Content-Type": "application/json"} if content is not None else None
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        async def send():
+            start = time.perf_counter()
+            try:
+                response = await client.request(request["method"], request["url"], content=content, headers=headers)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            return (time.perf_counter() - start) * 1000, ok
+
+        for _ in range(warmup):
+            await send()
+
+        latencies = []
+        errors = 0
+        remaining = requests
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                elapsed, ok = await send()
+                latencies.append(elapsed)
+                if not ok:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    return {"latencies": latencies, "errors": errors, "duration": duration}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Pools the latencies of several rounds and reports percentiles and throughput"""
+    latencies = sorted(l for run in runs for l in run["latencies"])
+    duration = sum(run["duration"] for run in runs)
+    return {
+        "requests": len(latencies),
+        "errors": sum(run["errors"] for run in runs),
+        "throughput_rps": round(len(latencies) / duration, 1) if duration > 0 else None,
+        "mean_ms": round(mean(latencies), 3) if latencies else None,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p90_ms": round(percentile(latencies, 0.90), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else None,
+    }
+
+
+async def benchmark_app(
+    scenarios: List[Dict[str, Any]],
+    bare_url: str,
+    wrapped_url: str,
+    concurrency_levels=DEFAULT_CONCURRENCY,
+    requests: int = 500,
+    rounds: int = 3,
+    setups=SETUPS,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Runs every scenario at every concurrency level against each setup.
+    Each (scenario, concurrency) pair is split into `rounds` rounds that visit
+    the setups in a shuffled order, so drift does not favour one setup.
+    """
+    rng = random.Random(seed)
+    results = []
+    for scenario in scenarios:
+        for concurrency in concurrency_levels:
+            runs = {setup: [] for setup in setups}
+            order = list(setups)
+            for _ in range(rounds):
+                rng.shuffle(order)
+                for setup in order:
+                    request = build_request(setup, scenario, bare_url, wrapped_url)
+                    runs[setup].append(await run_load(request, concurrency, max(requests // rounds, 1)))
+
+            row = {"scenario": scenario["name"], "concurrency": concurrency, "setups": {}}
+            for setup in setups:
+                row["setups"][setup] = summarize(runs[setup])
+            bare = row["setups"].get("bare")
+            if bare and bare["p50_ms"]:
+                for setup in setups:
+                    if setup != "bare":
+                        stats = row["setups"][setup]
+                        stats["p50_overhead_ms"] = round(stats["p50_ms"] - bare["p50_ms"], 3)
+                        stats["throughput_ratio"] = round(stats["throughput_rps"] / bare["throughput_rps"], 3) if bare["throughput_rps"] else None
+            results.append(row)
+            print(f"  {scenario['name']} @ {concurrency}: " + ", ".join(
+                f"{setup} p50={row['setups'][setup]['p50_ms']:.2f}ms {row['setups'][setup]['throughput_rps']}rps" for setup in setups
+            ), file=sys.stderr)
+    return results
+
+
+def run_suite(
+    concurrency_levels=DEFAULT_CONCURRENCY,
+    requests: int = 500,
+    rounds: int = 3,
+    synthetic_routes: int = SYNTHETIC_ROUTES,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Starts the bare and wrapped servers for each app in turn and benchmarks them"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="wrapper-overhead-") as work_dir:
+        synthetic_scenarios = [dict(s) for s in SYNTHETIC_SCENARIOS]
+        synthetic_scenarios[-1]["path"] = f"/resource{synthetic_routes - 1}/1"
+        apps = [
+            ("sample", SAMPLE_APP, SAMPLE_SCENARIOS),
+            ("synthetic", write_synthetic_app(work_dir, synthetic_routes), synthetic_scenarios),
+        ]
+        for name, app_file, scenarios in apps:
+            print(f"Benchmarking {name} app ({app_file})...", file=sys.stderr)
+            bare = start_bare_server(app_file)
+            try:
+                wrapped = start_wrapped_server(app_file, work_dir)
+                try:
+                    rows = asyncio.run(benchmark_app(
+                        scenarios, bare["url"], wrapped["url"],
+                        concurrency_levels=concurrency_levels, requests=requests, rounds=rounds, seed=seed,
+                    ))
+                finally:
+                    stop_server(wrapped)
+            finally:
+                stop_server(bare)
+            for row in rows:
+                row["app"] = name
+            results.extend(rows)
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "requests_per_point": requests,
+        "rounds": rounds,
+        "concurrency": list(concurrency_levels),
+        "synthetic_routes": synthetic_routes,
+        # Results recorded before this field existed ran src.server.wrapper:app directly
+        "wrapped_entrypoint": WRAPPED_ENTRYPOINT,
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"{'Scenario':38} {'Conc':>4}  {'Setup':8} {'p50':>9} {'p90':>9} {'p99':>9} {'req/s':>9} {'+p50':>9} {'Errors':>6}")
+    for row in report["results"]:
+        for setup, stats in row["setups"].items():
+            overhead = f"{stats['p50_overhead_ms']:+.2f}ms" if "p50_overhead_ms" in stats else ""
+            print(
+                f"{row['scenario']:38} {row['concurrency']:>4}  {setup:8} {stats['p50_ms']:>7.2f}ms {stats['p90_ms']:>7.2f}ms "
+                f"{stats['p99_ms']:>7.2f}ms {stats['throughput_rps'] or 0:>9.1f} {overhead:>9} {stats['errors']:>6}"
+            )
+
+
+def main():
+    import argparse
+
+    with open(os.path.join(PROJECT_ROOT, "config.json"), "r") as f:
+        config = json.load(f)
+
+    parser = argparse.ArgumentParser(description="Measure the wrapper's overhead against the bare user app on localhost")
+    parser.add_argument("--concurrency", default=",".join(str(c) for c in DEFAULT_CONCURRENCY), help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests per setup, scenario and concurrency level")
+    parser.add_argument("--rounds", type=int, default=3, help="Interleaved rounds the requests are split into")
+    parser.add_argument("--routes", type=int, default=SYNTHETIC_ROUTES, help="Number of routes in the synthetic app")
+    parser.add_argument("--output", default=os.path.join(PROJECT_ROOT, config.get("overheadResultsFile", "config/overhead_results.jsonl")),
+                        help="JSON Lines file the run is appended to")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the interleaving order")
+    args = parser.parse_args()
+
+    concurrency_levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    report = run_suite(concurrency_levels, requests=args.requests, rounds=args.rounds, synthetic_routes=args.routes, seed=args.seed)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "a") as f:
+        f.write(json.dumps(report) + "\n")
+    print(f"Appended results to {args.output}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
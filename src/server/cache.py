@@ -0,0 +1,146 @@
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+# Unsafe methods invalidate cached responses for their URL (RFC 9111, section 4.4)
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+# Status codes that are cacheable by default (RFC 9111, section 4.2.2)
+CACHEABLE_STATUS = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+BYPASS_HEADER = "x-proxy-cache-bypass"
+
+
+def parse_cache_control(value):
+    """Parses a Cache-Control header into {directive: value or True}"""
+    directives = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') if arg else True
+    return directives
+
+
+def _without_query(url):
+    parts = urlsplit(url)
+    return (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/")
+
+
+class ResponseCache:
+    """
+    LRU cache for proxied responses, bounded by entry count and total body size.
+    Entries expire after `ttl` seconds, or earlier if the upstream sent a
+    smaller Cache-Control max-age.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024, ttl=60, vary_headers=("accept", "authorization")):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.vary_headers = tuple(h.lower() for h in vary_headers)
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def key(self, method, url, headers):
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        return (method.upper(), url, tuple(lowered.get(h) for h in self.vary_headers))
+
+    def is_cacheable(self, method):
+        return method.upper() in CACHEABLE_METHODS
+
+    def invalidates(self, method, status):
+        """Whether a proxied response means cached entries for its URL are stale"""
+        return method.upper() not in SAFE_METHODS and status < 400
+
+    def invalidate(self, url):
+        """
+        Drops every entry (any method, query string or vary values) for the
+        resource at `url`. Ignoring the query over-invalidates slightly, but a
+        write such as PUT /items/1?notify=1 still clears GET /items/1.
+        Returns how many entries were dropped.
+        """
+        resource = _without_query(url)
+        stale = [key for key in self.entries if _without_query(key[1]) == resource]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def should_bypass(self, headers):
+        """Whether the client asked to skip the cache (bypass header, no-cache/no-store)"""
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        if lowered.get(BYPASS_HEADER):
+            return True
+        directives = parse_cache_control(lowered.get("cache-control"))
+        return "no-cache" in directives or "no-store" in directives
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, size, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, status, response_headers, value, size):
+        """Stores a response if its status and Cache-Control allow it"""
+        if status not in CACHEABLE_STATUS or size > self.max_bytes:
+            return False
+        directives = parse_cache_control(response_headers.get("cache-control"))
+        if "no-store" in directives or "no-cache" in directives or "private" in directives:
+            return False
+
+        ttl = self.ttl
+        max_age = directives.get("s-maxage", directives.get("max-age"))
+        if max_age is not None:
+            try:
+                ttl = min(ttl, int(max_age))
+            except (TypeError, ValueError):
+                pass
+        if ttl <= 0:
+            return False
+
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (time.monotonic() + ttl, size, value)
+        self.total_bytes += size
+        self.stores += 1
+
+        while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
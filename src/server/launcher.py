@@ -0,0 +1,195 @@
+import asyncio
+import importlib
+import json
+import mimetypes
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+STATIC_DIR = os.path.join(PROJECT_ROOT, 'static')
+
+CONFIG_PATH = os.environ.get('API_TESTER_CONFIG', os.path.join(PROJECT_ROOT, 'config.json'))
+with open(CONFIG_PATH, 'r') as f:
+    config = json.load(f)
+
+app_config = config.get('app', {})
+SERVER_HOST = app_config.get('host', '0.0.0.0')
+SERVER_PORT = app_config.get('port', 3020)
+
+
+async def _send_response(send, status, body, content_type="application/json", head=False):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"" if head else body})
+
+
+def _read_endpoints():
+    from src.generator.endpoints import ensure_endpoints_file
+
+    endpoints_path = ensure_endpoints_file(config, PROJECT_ROOT, CONFIG_PATH)
+    if os.path.exists(endpoints_path):
+        with open(endpoints_path, "rb") as f:
+            return f.read()
+    return None
+
+
+class LazyWrapperApp:
+    """
+    ASGI app that stands in for src.server.wrapper.app until it has loaded.
+
+    Only the standard library is imported before the socket is bound; the
+    wrapper and the user app (FastAPI, pydantic, httpx) are imported in a
+    background thread. While loading, the UI (/, /static/*), /api/config
+    and /api/endpoints are served directly; every other request is held
+    until the wrapped app is ready and then forwarded to it.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.load_error = None
+        self._loading = None
+        self._lifespan_queue = None
+        self._lifespan_task = None
+        self._lifespan_state = {}
+
+    def _ensure_loading(self):
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._load())
+        return self._loading
+
+    async def _load(self):
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            module = await loop.run_in_executor(None, importlib.import_module, "src.server.wrapper")
+            await self._start_inner_lifespan(module.app)
+        except (Exception, SystemExit) as e:
+            # The wrapper exits when the user app fails to load; keep the UI up and report it
+            self.load_error = str(e) or type(e).__name__
+            print(f"Error loading user server: {self.load_error}")
+            return
+        self.app = module.app
+        print(f"User server ready after {time.perf_counter() - start:.2f}s")
+
+    async def _start_inner_lifespan(self, app):
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+        self._lifespan_queue = asyncio.Queue()
+
+        async def send(message):
+            if message["type"].startswith("lifespan.startup") and not started.done():
+                started.set_result(message)
+
+        scope = {"type": "lifespan", "asgi": {"version": "3.0", "spec_version": "2.0"}, "state": self._lifespan_state}
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        self._lifespan_task = asyncio.ensure_future(app(scope, self._lifespan_queue.get, send))
+
+        await asyncio.wait({started, self._lifespan_task}, return_when=asyncio.FIRST_COMPLETED)
+        if started.done() and started.result()["type"] == "lifespan.startup.failed":
+            raise RuntimeError(started.result().get("message", "User app startup failed"))
+
+    async def _stop_inner_lifespan(self):
+        if self._lifespan_task is None or self._lifespan_task.done():
+            return
+        await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+        try:
+            await asyncio.wait_for(self._lifespan_task, timeout=10)
+        except Exception:
+            pass
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._ensure_loading()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._loading is not None and not self._loading.done():
+                    self._loading.cancel()
+                await self._stop_inner_lifespan()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _serve_early(self, scope, send):
+        """Serves the requests that do not need the user app. Returns False if not handled"""
+        if scope["method"] not in ("GET", "HEAD"):
+            return False
+        head = scope["method"] == "HEAD"
+        path = scope["path"]
+
+        if path == "/":
+            path = "/static/index.html"
+
+        if path.startswith("/static/"):
+            file_path = os.path.normpath(os.path.join(STATIC_DIR, path[len("/static/"):]))
+            if not file_path.startswith(STATIC_DIR + os.sep) or not os.path.isfile(file_path):
+                return False
+            with open(file_path, "rb") as f:
+                body = f.read()
+            content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            await _send_response(send, 200, body, content_type, head)
+            return True
+
+        if path == "/api/config":
+            body = json.dumps({
+                "serverPort": SERVER_PORT,
+                "serverHost": SERVER_HOST,
+                "serverUrl": f"http://localhost:{SERVER_PORT}"
+            }).encode()
+            await _send_response(send, 200, body, head=head)
+            return True
+
+        if path == "/api/endpoints":
+            body = b"[]"
+            try:
+                # Parsing the server file blocks; keep the loop free for the UI requests
+                body = await asyncio.get_running_loop().run_in_executor(None, _read_endpoints) or body
+            except Exception as e:
+                print(f"Error reading endpoints: {e}")
+            await _send_response(send, 200, body, head=head)
+            return True
+
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+
+        if self.app is None:
+            loading = self._ensure_loading()
+            if scope["type"] == "http" and await self._serve_early(scope, send):
+                return
+            await asyncio.shield(loading)
+
+        if self.app is None:
+            if scope["type"] == "http":
+                body = json.dumps({"error": f"User server failed to load: {self.load_error}"}).encode()
+                await _send_response(send, 503, body)
+            else:
+                await send({"type": "websocket.close", "code": 1011})
+            return
+
+        if self._lifespan_state:
+            scope = {**scope, "state": {**scope.get("state", {}), **self._lifespan_state}}
+        await self.app(scope, receive, send)
+
+
+def main():
+    """Starts the server without waiting for the user app to load"""
+    import uvicorn
+
+    print(f"Starting Wrapped Server on {SERVER_HOST}:{SERVER_PORT} (user app loads in background)...")
+    uvicorn.run(LazyWrapperApp(), host=SERVER_HOST, port=SERVER_PORT)
+
+
+if __name__ == "__main__":
+    main()
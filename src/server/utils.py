@@ -1,14 +1,183 @@
 import sys
 import inspect
 import json
+import linecache
 import traceback
 import asyncio
+import threading
+from collections import deque
+
+_MISSING = object()
+
+class TraceBuffer:
+    """
+    Columnar storage for trace steps.
+
+    Strings (function names, source lines, variable names) are interned into a
+    single table and every step is stored as indices into it. Locals are delta
+    encoded: each step only records the variables that changed or disappeared
+    since the previous step. When max_steps is set the buffer behaves like a
+    ring: the oldest steps are folded into a base snapshot and dropped.
+    """
+
+    def __init__(self, max_steps=None):
+        self.max_steps = max_steps
+        self.strings = []
+        self._string_index = {}
+        self.lines = deque()
+        self.functions = deque()
+        self.codes = deque()
+        self.sets = deque()
+        self.unsets = deque()
+        self.base = {}
+        self.dropped = 0
+        self._current = {}
+
+    def intern(self, value, new_strings=None):
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._string_index[value] = index
+            if new_strings is not None:
+                new_strings.append(value)
+        return index
+
+    def append(self, line, function, code, locals_dict):
+        """Records a step and returns it in its compact, streamable form."""
+        encoded_locals = {name: json.dumps(value) for name, value in locals_dict.items()}
+        return self.append_encoded(line, function, code, encoded_locals)
+
+    def append_encoded(self, line, function, code, encoded_locals):
+        """
+        Like append, but takes each local already JSON-encoded. Locals are
+        compared by their encoding (so 1, 1.0 and True count as changes) and
+        only the changed ones are decoded into the step.
+        """
+        new_strings = []
+        function_index = self.intern(function, new_strings)
+        code_index = self.intern(code, new_strings)
+
+        changed = []
+        encodings = {}
+        for name, encoded in encoded_locals.items():
+            name_index = self.intern(name, new_strings)
+            if self._current.get(name_index, _MISSING) != encoded:
+                changed.append([name_index, json.loads(encoded)])
+                encodings[name_index] = encoded
+        removed = []
+        for name_index in self._current:
+            if self.strings[name_index] not in encoded_locals:
+                removed.append(name_index)
+
+        self._current.update(encodings)
+        for name_index in removed:
+            del self._current[name_index]
+
+        if self.max_steps is not None and len(self.lines) >= self.max_steps:
+            self._evict()
+
+        self.lines.append(line)
+        self.functions.append(function_index)
+        self.codes.append(code_index)
+        self.sets.append(changed)
+        self.unsets.append(removed)
+
+        return {
+            "strings": new_strings,
+            "line": line,
+            "function": function_index,
+            "code": code_index,
+            "set": changed,
+            "unset": removed,
+        }
+
+    def _evict(self):
+        self.lines.popleft()
+        self.functions.popleft()
+        self.codes.popleft()
+        for name_index, value in self.sets.popleft():
+            self.base[name_index] = value
+        for name_index in self.unsets.popleft():
+            self.base.pop(name_index, None)
+        self.dropped += 1
+
+    def __len__(self):
+        return len(self.lines)
+
+    def to_dict(self):
+        return {
+            "format": "columnar-v1",
+            "strings": self.strings,
+            "base": [[k, v] for k, v in self.base.items()],
+            "dropped": self.dropped,
+            "line": list(self.lines),
+            "function": list(self.functions),
+            "code": list(self.codes),
+            "set": list(self.sets),
+            "unset": list(self.unsets),
+        }
+
+    def expand(self):
+        """Rebuilds the verbose per-step entries (full locals on every step)."""
+        entries = []
+        state = dict(self.base)
+        for line, function, code, changed, removed in zip(
+            self.lines, self.functions, self.codes, self.sets, self.unsets
+        ):
+            for name_index in removed:
+                state.pop(name_index, None)
+            for name_index, value in changed:
+                state[name_index] = value
+            entries.append({
+                "line": line,
+                "function": self.strings[function],
+                "code": self.strings[code],
+                "locals": {self.strings[k]: v for k, v in state.items()},
+            })
+        return entries
+
+def coalesce_steps(older, newer):
+    """
+    Merges two consecutive compact steps (see TraceBuffer.append) into one that
+    has the position of `newer` and the combined effect of both on the locals.
+    """
+    sets = dict(older["set"])
+    unsets = list(older["unset"])
+    for name_index in newer["unset"]:
+        sets.pop(name_index, None)
+        if name_index not in unsets:
+            unsets.append(name_index)
+    for name_index, value in newer["set"]:
+        sets[name_index] = value
+        if name_index in unsets:
+            unsets.remove(name_index)
+    return {
+        "strings": older["strings"] + newer["strings"],
+        "line": newer["line"],
+        "function": newer["function"],
+        "code": newer["code"],
+        "set": [[k, v] for k, v in sets.items()],
+        "unset": unsets,
+        "coalesced": older.get("coalesced", 1) + newer.get("coalesced", 1),
+    }
+
+class DebugCancelled(BaseException):
+    """
+    Raised when a debug run is cancelled. Like asyncio.CancelledError it is a
+    BaseException, so handlers catching Exception do not swallow it.
+    """
 
 class Tracer:
-    def __init__(self):
-        self.trace_log = []
+    def __init__(self, max_steps=None, on_step=None):
+        self.trace_log = TraceBuffer(max_steps)
+        self.on_step = on_step
+        self.cancelled = threading.Event()
         self.start_frame = None
         self.target_code = None
+        # Set while an async run is in flight; cancel() stops it through the task
+        self._task = None
+        self._loop = None
         self.log_file = open("tracer_debug.log", "w")
 
     def log(self, msg):
@@ -16,61 +185,84 @@ class Tracer:
         self.log_file.flush()
 
     def _serialize_value(self, value):
+        """
+        Returns the JSON encoding of a local. The encoding doubles as a snapshot,
+        so later in-place mutation of a container shows up as a delta.
+        """
         try:
             # Try basic JSON serialization
-            json.dumps(value)
-            return value
-        except (TypeError, OverflowError):
+            return json.dumps(value)
+        except (TypeError, ValueError, OverflowError):
             # Fallback to string representation
-            return str(value)
+            return json.dumps(str(value))
+
+    def cancel(self):
+        """
+        Stops the traced function. A sync run stops at its next traced event;
+        code blocked in a C call (e.g. time.sleep) only stops once that call
+        returns. An async run is cancelled at its next await.
+        """
+        self.cancelled.set()
+        if self._task is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+    def _in_run(self, frame):
+        """True for the traced function's frame and every frame it calls"""
+        while frame is not None:
+            if frame is self.start_frame:
+                return True
+            frame = frame.f_back
+        return False
 
     def _trace_func(self, frame, event, arg):
         # self.log(f"Trace event: {event} in {frame.f_code.co_name} at {frame.f_lineno}")
-        
+
         if self.start_frame is None:
             if self.target_code and frame.f_code == self.target_code:
                 self.log(f"Found target code! Starting trace at {frame.f_lineno}")
                 self.start_frame = frame
             else:
-                # Keep tracing until we find the target
-                # self.log(f"Skipping {frame.f_code.co_name}, waiting for target...")
-                return self._trace_func
+                # Not the target: skip its lines, its calls still reach us
+                return None
+        elif not self._in_run(frame):
+            # Other tasks on the event loop during an async run, or the
+            # caller once the traced function has returned
+            return None
+
+        if self.cancelled.is_set() and self._task is None:
+            # Raising from the trace function propagates into the traced frame
+            raise DebugCancelled("Debug run cancelled")
 
         # We have started tracing the target
-        
+
         # Filter: Only trace lines in the same file as the start frame
         if frame.f_code.co_filename != self.start_frame.f_code.co_filename:
             return self._trace_func
 
         if event == 'line':
-            locals_dict = {}
+            encoded_locals = {}
             for name, value in frame.f_locals.items():
-                locals_dict[name] = self._serialize_value(value)
+                encoded_locals[name] = self._serialize_value(value)
 
-            # Get source line
-            try:
-                with open(frame.f_code.co_filename, 'r') as f:
-                    all_lines = f.readlines()
-                    if 0 <= frame.f_lineno - 1 < len(all_lines):
-                        line_content = all_lines[frame.f_lineno - 1].strip()
-                    else:
-                        line_content = "<could not read source>"
-            except Exception as e:
-                line_content = f"<source unavailable: {e}>"
-
-            entry = {
-                "line": frame.f_lineno,
-                "function": frame.f_code.co_name,
-                "code": line_content,
-                "locals": locals_dict
-            }
-            self.trace_log.append(entry)
-            self.log(f"Captured line {frame.f_lineno}: {line_content}")
+            # Get source line (linecache keeps the file in memory between steps)
+            line_content = linecache.getline(frame.f_code.co_filename, frame.f_lineno).strip()
+            if not line_content:
+                line_content = "<could not read source>"
+
+            step = self.trace_log.append_encoded(
+                frame.f_lineno,
+                frame.f_code.co_name,
+                line_content,
+                encoded_locals
+            )
+            if self.on_step:
+                self.on_step(step)
 
         return self._trace_func
 
     def run(self, func, *args, **kwargs):
-        self.target_code = func.__code__
+        # Trace the undecorated function even when called through its decorators
+        self.target_code = inspect.unwrap(func).__code__
         self.log(f"Starting sync trace for {func.__name__}")
         sys.settrace(self._trace_func)
         try:
@@ -80,14 +272,33 @@ class Tracer:
             self.log("Trace finished")
 
     async def run_async(self, func, *args, **kwargs):
-        self.target_code = func.__code__
+        # Trace the undecorated function even when called through its decorators
+        self.target_code = inspect.unwrap(func).__code__
         self.log(f"Starting async trace for {func.__name__}")
+        if self.cancelled.is_set():
+            raise DebugCancelled("Debug run cancelled")
+        # Runs as its own task so cancel() can stop it with task.cancel(). The
+        # trace function stays installed on the loop thread while we wait, and
+        # ignores frames that do not belong to this run.
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.ensure_future(func(*args, **kwargs))
         sys.settrace(self._trace_func)
         try:
-            return await func(*args, **kwargs)
+            try:
+                await asyncio.wait({self._task})
+            except asyncio.CancelledError:
+                # Our caller was cancelled (e.g. a timeout): take the run with us
+                self._task.cancel()
+                raise
+            if self._task.cancelled():
+                raise DebugCancelled("Debug run cancelled")
+            return self._task.result()
         finally:
             sys.settrace(None)
             self.log("Trace finished")
 
     def get_log(self):
-        return self.trace_log
+        return self.trace_log.expand()
+
+    def get_compact(self):
+        return self.trace_log.to_dict()
@@ -1,24 +1,33 @@
-import uvicorn
 import json
 import sys
 import os
 import importlib.util
 import inspect
+import asyncio
+import functools
+import re
+import uuid
+import contextvars
+import threading
+from urllib.parse import urlencode, urljoin, quote, unquote
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import Request, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import httpx
+from fastapi.concurrency import run_in_threadpool
 
 # Add project root to path for imports
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.server.utils import Tracer
+from src.server.utils import Tracer, DebugCancelled, coalesce_steps
+from src.generator.endpoints import ensure_endpoints_file
+from src.server.cache import ResponseCache, BYPASS_HEADER
 
-# Load config (from root directory)
-config_path = os.path.join(PROJECT_ROOT, 'config.json')
+# Load config (from root directory, or API_TESTER_CONFIG when set)
+config_path = os.environ.get('API_TESTER_CONFIG', os.path.join(PROJECT_ROOT, 'config.json'))
 with open(config_path, 'r') as f:
     config = json.load(f)
 
@@ -27,6 +36,24 @@ app_config = config.get('app', {})
 SERVER_HOST = app_config.get('host', '0.0.0.0')
 SERVER_PORT = app_config.get('port', 3020)
 PYTHON_FILE = config.get('pythonServerFile', './api_server.py')
+# Ring-buffer cap for traces; older steps are folded into a base snapshot
+DEBUG_MAX_TRACE_STEPS = config.get('debugMaxTraceSteps', 10000)
+# Sync handlers are debugged in a bounded pool so a slow handler cannot block the event loop
+DEBUG_MAX_WORKERS = config.get('debugMaxWorkers', 4)
+DEBUG_TIMEOUT_SECONDS = config.get('debugTimeoutSeconds', 60)
+# Steps /debug/stream buffers for a slow client before coalescing them
+DEBUG_STREAM_QUEUE_SIZE = DEBUG_MAX_TRACE_STEPS or 10000
+
+# Opt-in cache for idempotent proxied requests
+proxy_cache_config = config.get('proxyCache', {})
+proxy_cache = None
+if proxy_cache_config.get('enabled', False):
+    proxy_cache = ResponseCache(
+        max_entries=proxy_cache_config.get('maxEntries', 256),
+        max_bytes=proxy_cache_config.get('maxBytes', 16 * 1024 * 1024),
+        ttl=proxy_cache_config.get('ttlSeconds', 60),
+        vary_headers=proxy_cache_config.get('varyHeaders', ['accept', 'authorization'])
+    )
 
 def load_user_app(file_path):
     module_name = os.path.basename(file_path).replace('.py', '')
@@ -115,19 +142,56 @@ async def get_config():
         "serverUrl": f"http://localhost:{SERVER_PORT}"
     }
 
+def _read_endpoints():
+    endpoints_path = ensure_endpoints_file(config, PROJECT_ROOT, config_path)
+    if os.path.exists(endpoints_path):
+        with open(endpoints_path, 'r') as f:
+            return json.load(f)
+    return []
+
 @app.get("/api/endpoints")
 async def get_endpoints():
-    """Returns the generated endpoints configuration"""
-    endpoints_path = os.path.join(CONFIG_DIR, "endpoints.json")
-    if os.path.exists(endpoints_path):
-        try:
-            with open(endpoints_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error reading endpoints: {e}")
-            return []
+    """Returns the generated endpoints configuration, parsing the server file on first use"""
+    try:
+        # Parsing and writing the file block, so keep them off the event loop
+        return await run_in_threadpool(_read_endpoints)
+    except Exception as e:
+        print(f"Error reading endpoints: {e}")
     return []
 
+@app.post("/api/fuzz")
+async def fuzz_endpoints(request: Request):
+    """
+    Runs the schema-driven fuzz runner against this server.
+    Optional JSON body: { "concurrency": 8, "repeat": 3, "paths": ["/path", ...] }
+    """
+    from src.runner.fuzz import run_fuzz
+
+    try:
+        data = await request.json()
+    except Exception:
+        data = {}
+
+    concurrency = data.get("concurrency", 8)
+    repeat = data.get("repeat", 3)
+    for name, value in (("concurrency", concurrency), ("repeat", repeat)):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"{name} must be a positive integer"}
+            )
+
+    endpoints = await get_endpoints()
+    if data.get("paths"):
+        endpoints = [ep for ep in endpoints if ep["path"] in data["paths"]]
+
+    return await run_fuzz(
+        f"http://localhost:{SERVER_PORT}",
+        endpoints,
+        concurrency=concurrency,
+        repeat=repeat
+    )
+
 @app.post("/api/proxy")
 async def proxy_request(request: Request):
     """Proxies requests to the FastAPI backend (for backward compatibility)"""
@@ -144,7 +208,27 @@ async def proxy_request(request: Request):
                 content={"error": "URL is required"}
             )
         
+        # Serve idempotent requests from the cache when enabled
+        cache_key = None
+        cache_status = "DISABLED" if proxy_cache is None else "UNCACHEABLE"
+        if proxy_cache is not None and proxy_cache.is_cacheable(method):
+            if proxy_cache.should_bypass(headers) or request.headers.get(BYPASS_HEADER):
+                proxy_cache.bypasses += 1
+                cache_status = "BYPASS"
+            else:
+                cache_key = proxy_cache.key(method, url, headers)
+                cached = proxy_cache.get(cache_key)
+                if cached is not None:
+                    return JSONResponse(
+                        status_code=cached["status"],
+                        content=cached,
+                        headers={"X-Proxy-Cache": "HIT"}
+                    )
+                cache_status = "MISS"
+        headers = {k: v for k, v in headers.items() if k.lower() != BYPASS_HEADER}
+
         # Make request to the backend
+        import httpx
         async with httpx.AsyncClient() as client:
             response = await client.request(
                 method=method,
@@ -154,13 +238,30 @@ async def proxy_request(request: Request):
                 timeout=30.0
             )
             
+            if method.upper() == "HEAD" or not response.content:
+                response_data = None
+            elif response.headers.get("content-type", "").startswith("application/json"):
+                response_data = response.json()
+            else:
+                response_data = response.text
+            content = {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "data": response_data
+            }
+            if cache_key is not None:
+                proxy_cache.put(cache_key, response.status_code, response.headers, content, len(response.content))
+            elif proxy_cache is not None and proxy_cache.invalidates(method, response.status_code):
+                # The target (and any Location/Content-Location it names) may have changed
+                proxy_cache.invalidate(url)
+                for name in ("location", "content-location"):
+                    if response.headers.get(name):
+                        proxy_cache.invalidate(urljoin(url, response.headers[name]))
+
             return JSONResponse(
                 status_code=response.status_code,
-                content={
-                    "status": response.status_code,
-                    "headers": dict(response.headers),
-                    "data": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text
-                }
+                content=content,
+                headers={"X-Proxy-Cache": cache_status}
             )
     except Exception as e:
         import traceback
@@ -170,6 +271,20 @@ async def proxy_request(request: Request):
             content={"error": str(e), "details": traceback.format_exc()}
         )
 
+@app.get("/api/proxy/cache")
+async def get_proxy_cache_stats():
+    """Returns proxy cache hit/miss counters"""
+    if proxy_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **proxy_cache.stats()}
+
+@app.delete("/api/proxy/cache")
+async def clear_proxy_cache():
+    """Drops all cached proxy responses"""
+    if proxy_cache is not None:
+        proxy_cache.clear()
+    return {"cleared": proxy_cache is not None}
+
 # --- Inject Debug Endpoints ---
 
 @app.post("/source")
@@ -222,82 +337,340 @@ async def get_source_endpoint(request: Request):
         print(f"Error in source endpoint: {e}")
         return {"error": str(e)}
 
+def _find_route(target_path, target_method):
+    for route in app.routes:
+        if hasattr(route, "path") and route.path == target_path:
+            if target_method in getattr(route, "methods", ()):
+                return route
+    return None
+
+def _get_function_source(target_func):
+    try:
+        source_lines, start_line = inspect.getsourcelines(target_func)
+        return "".join(source_lines), start_line
+    except Exception:
+        return "Source not available", 0
+
+def _prepare_debug(data):
+    """Resolves the target route and function from a /debug request body"""
+    target_path = data.get("path")
+    target_method = data.get("method", "GET").upper()
+
+    target_route = _find_route(target_path, target_method)
+    if not target_route:
+        raise HTTPException(status_code=404, detail="Endpoint not found")
+
+    target_func = inspect.unwrap(target_route.endpoint) # Unwrap for debugging too
+    print(f"Debugging target function: {target_func.__name__}")
+
+    return target_route, target_func
+
+debug_executor = ThreadPoolExecutor(max_workers=DEBUG_MAX_WORKERS, thread_name_prefix="debug")
+# Tracers of in-flight debug runs by id, so they can be cancelled
+active_debug_runs = {}
+
+async def _run_traced(tracer, target_func, kwargs):
+    """
+    Runs target_func under the tracer. Sync functions run in debug_executor;
+    sys.settrace only affects the calling thread, so the trace stays confined
+    to the worker. Cancels the run if it exceeds DEBUG_TIMEOUT_SECONDS:
+    wait_for cancels an async run's task, the tracer stops a sync one.
+    """
+    if inspect.iscoroutinefunction(target_func):
+        run = tracer.run_async(target_func, **kwargs)
+    else:
+        loop = asyncio.get_running_loop()
+        # Like run_in_threadpool, carry over ContextVars set by middleware and dependencies
+        context = contextvars.copy_context()
+        run = loop.run_in_executor(debug_executor, context.run, functools.partial(tracer.run, target_func, **kwargs))
+
+    try:
+        return await asyncio.wait_for(run, timeout=DEBUG_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        tracer.cancel()
+        raise TimeoutError(f"Debug run exceeded {DEBUG_TIMEOUT_SECONDS}s and was cancelled")
+
+# --- Request emulation for /debug ---
+# Each debugged route gets a hidden copy under DEBUG_ROUTE_PREFIX whose endpoint
+# runs the original under the current run's tracer. Synthetic requests go
+# through the whole app, so validation and Depends() resolve exactly as for a
+# real request, while only the endpoint function itself is traced.
+
+DEBUG_ROUTE_PREFIX = "/__debug__"
+_debug_tracer = contextvars.ContextVar("debug_tracer", default=None)
+# (path, methods) of the original route -> path of its debug copy (built once per route)
+_debug_routes = {}
+
+def _get_debug_route_path(route):
+    route_key = (route.path, frozenset(route.methods))
+    if route_key in _debug_routes:
+        return _debug_routes[route_key]
+
+    endpoint = route.endpoint
+
+    @functools.wraps(endpoint)
+    async def traced_endpoint(*args, **kwargs):
+        tracer = _debug_tracer.get()
+        if tracer is None:
+            # Hit directly rather than through /debug: behave like the original
+            if inspect.iscoroutinefunction(endpoint):
+                return await endpoint(*args, **kwargs)
+            return await run_in_threadpool(endpoint, *args, **kwargs)
+        return await _run_traced(tracer, endpoint, kwargs)
+
+    debug_path = DEBUG_ROUTE_PREFIX + route.path
+    app.add_api_route(
+        debug_path,
+        traced_endpoint,
+        methods=list(route.methods),
+        dependencies=route.dependencies,
+        response_model=route.response_model,
+        status_code=route.status_code,
+        response_class=route.response_class,
+        response_model_include=route.response_model_include,
+        response_model_exclude=route.response_model_exclude,
+        response_model_by_alias=route.response_model_by_alias,
+        response_model_exclude_unset=route.response_model_exclude_unset,
+        response_model_exclude_defaults=route.response_model_exclude_defaults,
+        response_model_exclude_none=route.response_model_exclude_none,
+        include_in_schema=False,
+        name=f"{route.name}_debug",
+    )
+    _debug_routes[route_key] = debug_path
+    return debug_path
+
+def _fill_path_params(path, path_params):
+    """
+    Substitutes path parameters into a route path template.
+    Returns (path, raw_path): the decoded path the router matches on and the
+    percent-encoded bytes a client would send. Only {name:path} parameters
+    may contain "/".
+    """
+    encoded = ""
+    position = 0
+    for match in re.finditer(r"\{([^}:]+)(?::([^}]*))?\}", path):
+        name, converter = match.group(1), match.group(2)
+        if name not in path_params:
+            raise ValueError(f"Missing path parameter: {name}")
+        encoded += quote(path[position:match.start()], safe="/")
+        encoded += quote(str(path_params[name]), safe="/" if converter == "path" else "")
+        position = match.end()
+    encoded += quote(path[position:], safe="/")
+    return unquote(encoded), encoded.encode("ascii")
+
+async def _emulate_request(route, data, tracer, state=None):
+    """
+    Sends a synthetic request for `route` through the app with `tracer` active.
+    Returns (status, result) where result is the decoded response body.
+    """
+    path, raw_path = _fill_path_params(_get_debug_route_path(route), data.get("path_params") or {})
+    body = data.get("body")
+    body_bytes = json.dumps(body).encode() if body is not None else b""
+
+    headers = {"content-type": "application/json", **{k.lower(): str(v) for k, v in (data.get("headers") or {}).items()}}
+    headers["content-length"] = str(len(body_bytes))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": data.get("method", "GET").upper(),
+        "scheme": "http",
+        "path": path,
+        "raw_path": raw_path,
+        "root_path": "",
+        "query_string": urlencode(data.get("query") or {}, doseq=True).encode(),
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", SERVER_PORT),
+        "state": dict(state or {}),
+    }
+
+    response_done = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body_bytes, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    status = None
+    response_headers = {}
+    chunks = []
+
+    async def send(message):
+        nonlocal status, response_headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    token = _debug_tracer.set(tracer)
+    try:
+        await app(scope, receive, send)
+    finally:
+        _debug_tracer.reset(token)
+        response_done.set()
+
+    content = b"".join(chunks)
+    if response_headers.get("content-type", "").startswith("application/json"):
+        result = json.loads(content) if content else None
+    else:
+        result = content.decode(errors="replace")
+    return status, result
+
 @app.post("/debug")
 async def debug_endpoint(request: Request):
     """
-    Debugs a function by path.
-    Expects JSON body: { "path": "/path", "method": "POST", "body": {...}, "query": {...} }
+    Debugs an endpoint by sending it a synthetic request.
+    Expects JSON body: {
+        "path": "/items/{item_id}", "method": "POST", "path_params": {...},
+        "query": {...}, "headers": {...}, "body": {...}, "id": "..."
+    }
+    The optional id can be passed to /debug/cancel while the run is in progress.
+    The trace is returned in the columnar format produced by TraceBuffer.to_dict().
     """
     print("Debug endpoint hit (in wrapper)")
+    run_id = None
     try:
         data = await request.json()
-        target_path = data.get("path")
-        target_method = data.get("method", "GET").upper()
-        request_body = data.get("body", {})
+        target_route, target_func = _prepare_debug(data)
 
-        # Find the route
-        target_route = None
-        for route in app.routes:
-            if hasattr(route, "path") and route.path == target_path:
-                if target_method in route.methods:
-                    target_route = route
-                    break
-        
-        if not target_route:
-            raise HTTPException(status_code=404, detail="Endpoint not found")
-
-        # Get the function
-        target_func = target_route.endpoint
-        target_func = inspect.unwrap(target_func) # Unwrap for debugging too
-        
-        print(f"Debugging target function: {target_func.__name__}")
-        
-        # Prepare arguments
-        sig = inspect.signature(target_func)
-        kwargs = {}
-        
-        for param_name, param in sig.parameters.items():
-            # Check if it's a Pydantic model
-            if issubclass(param.annotation, BaseModel):
-                try:
-                    model_instance = param.annotation(**request_body)
-                    kwargs[param_name] = model_instance
-                except Exception as e:
-                    return {"error": f"Failed to validate body for {param_name}: {str(e)}"}
-            else:
-                if param_name in request_body:
-                    kwargs[param_name] = request_body[param_name]
-        
-        # Run with Tracer
-        tracer = Tracer()
-        
-        if inspect.iscoroutinefunction(target_func):
-            result = await tracer.run_async(target_func, **kwargs)
-        else:
-            result = tracer.run(target_func, **kwargs)
-            
-        # Get source code
-        try:
-            source_lines, start_line = inspect.getsourcelines(target_func)
-            source_code = "".join(source_lines)
-        except:
-            source_code = "Source not available"
-            start_line = 0
+        run_id = data.get("id") or uuid.uuid4().hex
+        tracer = Tracer(max_steps=DEBUG_MAX_TRACE_STEPS)
+        active_debug_runs[run_id] = tracer
+        status, result = await _emulate_request(target_route, data, tracer, request.scope.get("state"))
+        source_code, start_line = _get_function_source(target_func)
 
         return {
+            "id": run_id,
+            "status": status,
             "result": result,
-            "trace": tracer.get_log(),
+            "trace": tracer.get_compact(),
             "source": source_code,
             "start_line": start_line
         }
 
+    except DebugCancelled as e:
+        return {"id": run_id, "cancelled": True, "error": str(e), "trace": tracer.get_compact()}
     except Exception as e:
         import traceback
         traceback.print_exc()
         return {"error": str(e), "details": traceback.format_exc()}
+    finally:
+        active_debug_runs.pop(run_id, None)
+
+@app.post("/debug/cancel")
+async def cancel_debug_endpoint(request: Request):
+    """
+    Cancels an in-flight debug run.
+    Expects JSON body: { "id": "..." }
+    """
+    data = await request.json()
+    tracer = active_debug_runs.get(data.get("id"))
+    if tracer is None:
+        return {"cancelled": False, "error": "No active debug run with that id"}
+    tracer.cancel()
+    return {"cancelled": True}
+
+def _sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(payload))}\n\n"
+
+@app.post("/debug/stream")
+async def debug_stream_endpoint(request: Request):
+    """
+    Debugs a function by path, streaming trace steps as Server-Sent Events.
+    Same request body as /debug. Emits a "source" event (including the run id
+    for /debug/cancel), one "step" event per traced line (compact form, see
+    TraceBuffer.append) and a final "done" or "error" event. Disconnecting
+    cancels the run.
+    """
+    print("Debug stream endpoint hit (in wrapper)")
+    try:
+        data = await request.json()
+        target_route, target_func = _prepare_debug(data)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+
+    loop = asyncio.get_running_loop()
+    loop_thread = threading.get_ident()
+    # Bounded so a slow client cannot make the server buffer the whole trace;
+    # steps that do not fit are coalesced into the next one that does
+    queue = asyncio.Queue(maxsize=DEBUG_STREAM_QUEUE_SIZE)
+    pending = None
+    coalesced = 0
+
+    def enqueue_step(step):
+        nonlocal pending, coalesced
+        if pending is not None:
+            step = coalesce_steps(pending, step)
+            pending = None
+        if queue.full():
+            pending = step
+            coalesced += 1
+        else:
+            queue.put_nowait(("step", step))
+
+    def on_step(step):
+        # Sync handlers run in a debug worker thread, async ones on the loop
+        if threading.get_ident() == loop_thread:
+            enqueue_step(step)
+        else:
+            loop.call_soon_threadsafe(enqueue_step, step)
+
+    run_id = data.get("id") or uuid.uuid4().hex
+    tracer = Tracer(max_steps=DEBUG_MAX_TRACE_STEPS, on_step=on_step)
+    state = request.scope.get("state")
+
+    async def run():
+        try:
+            status, result = await _emulate_request(target_route, data, tracer, state)
+            event = ("done", {
+                "status": status,
+                "result": result,
+                "steps": len(tracer.trace_log),
+                "dropped": tracer.trace_log.dropped,
+                "coalesced": coalesced,
+            })
+        except DebugCancelled as e:
+            event = ("error", {"error": str(e), "cancelled": True})
+        except Exception as e:
+            import traceback
+            event = ("error", {"error": str(e), "details": traceback.format_exc()})
+        if pending is not None:
+            await queue.put(("step", pending))
+        await queue.put(event)
+
+    async def event_stream():
+        source_code, start_line = _get_function_source(target_func)
+        yield _sse_event("source", {"id": run_id, "source": source_code, "start_line": start_line})
+
+        active_debug_runs[run_id] = tracer
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                event, payload = await queue.get()
+                yield _sse_event(event, payload)
+                if event in ("done", "error"):
+                    break
+        finally:
+            active_debug_runs.pop(run_id, None)
+            if not task.done():
+                tracer.cancel()
+                task.cancel()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 def main():
     """Main entry point for the server"""
+    import uvicorn
+
     print(f"Starting Wrapped Server on {SERVER_HOST}:{SERVER_PORT}...")
     uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
 
@@ -4,6 +4,13 @@
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 cd "$SCRIPT_DIR"
 
+# Headless benchmark mode: ./start.sh --benchmark [benchmark args...]
+BENCHMARK_MODE=false
+if [ "$1" == "--benchmark" ]; then
+    BENCHMARK_MODE=true
+    shift
+fi
+
 # Read configuration from config.json
 CONFIG_FILE="config.json"
 
@@ -23,11 +30,17 @@ fi
 echo "🔌 Activating virtual environment..."
 source "$VENV_DIR/bin/activate"
 
-# Install/update requirements
+# Install/update requirements (skipped when requirements.txt is unchanged)
 if [ -f "requirements.txt" ]; then
-    echo "📥 Installing/updating Python dependencies..."
-    pip install -q --upgrade pip
-    pip install -q -r requirements.txt
+    REQUIREMENTS_HASH_FILE="$VENV_DIR/.requirements.sha256"
+    REQUIREMENTS_HASH=$(python -c "import hashlib; print(hashlib.sha256(open('requirements.txt', 'rb').read()).hexdigest())")
+    if [ ! -f "$REQUIREMENTS_HASH_FILE" ] || [ "$(cat "$REQUIREMENTS_HASH_FILE")" != "$REQUIREMENTS_HASH" ]; then
+        echo "📥 Installing/updating Python dependencies..."
+        pip install -q --upgrade pip
+        pip install -q -r requirements.txt && echo "$REQUIREMENTS_HASH" > "$REQUIREMENTS_HASH_FILE"
+    else
+        echo "📥 Python dependencies up to date"
+    fi
 fi
 
 # Helper to read JSON value (using venv python)
@@ -72,23 +85,35 @@ echo "Configuration loaded:"
 echo "  Server Host:       $API_SERVER_HOST"
 echo "  Server Port:       $API_SERVER_PORT"
 
-# Generate endpoints if configured
-if python -c "import json; c=json.load(open('$CONFIG_FILE')); exit(0 if c.get('autoGenerateEndpoints', False) else 1)" 2>/dev/null; then
-    echo "---------------------------------------------------"
-    echo "📝 Generating endpoints..."
-    python -m src.generator.endpoints
-fi
-
 # Start Python Server (serves both API and UI)
+# The UI is served immediately; the user app loads in the background and
+# endpoints are regenerated on first request when autoGenerateEndpoints is set
 echo "---------------------------------------------------"
 echo "🧪 Starting API Tester Server..."
-python -m src.server.wrapper > api_tester.log 2>&1 &
+python -m src.server.launcher > api_tester.log 2>&1 &
 API_SERVER_PID=$!
 echo "   -> Server running in background (logs in api_tester.log)"
 echo "   -> PID: $API_SERVER_PID"
 
-# Wait a moment for server to start
-sleep 3
+# Wait until the server answers instead of a fixed sleep
+for _ in $(seq 1 60); do
+    if python -c "import urllib.request; urllib.request.urlopen('http://localhost:$API_SERVER_PORT/api/config', timeout=1)" 2>/dev/null; then
+        break
+    fi
+    sleep 0.1
+done
+
+if [ "$BENCHMARK_MODE" = true ]; then
+    echo "---------------------------------------------------"
+    echo "⏱️  Running benchmark..."
+    python -m src.runner.benchmark --url "http://localhost:$API_SERVER_PORT" "$@"
+    BENCHMARK_STATUS=$?
+
+    kill $API_SERVER_PID 2>/dev/null
+    wait $API_SERVER_PID 2>/dev/null
+    deactivate 2>/dev/null
+    exit $BENCHMARK_STATUS
+fi
 
 echo "---------------------------------------------------"
 echo "🎉 Server is up and running!"
@@ -3,12 +3,164 @@ let currentEndpoint = null;
 let serverUrl = 'http://localhost:8011';
 let testResults = [];
 
+// Sidebar state: only the rows in view are in the DOM (see VirtualList)
+let endpointList = null;
+let endpointSearchIndex = [];
+let filteredEndpointIndices = [];
+let selectedEndpointIndex = -1;
+
+const FILTER_DEBOUNCE_MS = 150;
+
 document.addEventListener('DOMContentLoaded', async () => {
     await loadConfig();
     await loadEndpoints();
     setupEventListeners();
 });
 
+function escapeHtml(value) {
+    return String(value)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
+function debounce(fn, delay) {
+    let timer = null;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), delay);
+    };
+}
+
+/**
+ * Virtualized list: renders only the items inside the scroll viewport (plus
+ * some overscan) between two spacers sized to the items that are skipped.
+ * Item heights are measured after rendering and cached, so items may differ
+ * in height (e.g. expanded test result rows). Renders are batched per frame.
+ */
+class VirtualList {
+    constructor({ scrollElement, container, renderItem, estimatedHeight, spacer, overscan = 400 }) {
+        this.scrollElement = scrollElement;
+        this.container = container;
+        this.renderItem = renderItem;
+        this.estimatedHeight = estimatedHeight;
+        this.spacer = spacer || (height => `<div style="height: ${height}px"></div>`);
+        this.overscan = overscan;
+        this.count = 0;
+        this.heights = new Map();
+        this.offsets = new Float64Array(1);
+        this.offsetsDirty = true;
+        this.frame = null;
+
+        this.scrollElement.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+        window.addEventListener('resize', () => this.scheduleRender());
+    }
+
+    setCount(count) {
+        this.count = count;
+        this.offsetsDirty = true;
+        this.scheduleRender();
+    }
+
+    reset(count = 0) {
+        this.heights.clear();
+        this.setCount(count);
+    }
+
+    // Forget the measured height of one item (its content changed)
+    invalidate(index) {
+        this.heights.delete(index);
+        this.offsetsDirty = true;
+        this.scheduleRender();
+    }
+
+    refresh() {
+        this.scheduleRender();
+    }
+
+    scheduleRender() {
+        if (this.frame === null) {
+            this.frame = requestAnimationFrame(() => {
+                this.frame = null;
+                this.render();
+            });
+        }
+    }
+
+    heightOf(index) {
+        return this.heights.get(index) ?? this.estimatedHeight;
+    }
+
+    computeOffsets() {
+        if (!this.offsetsDirty) return;
+        this.offsets = new Float64Array(this.count + 1);
+        for (let i = 0; i < this.count; i++) {
+            this.offsets[i + 1] = this.offsets[i] + this.heightOf(i);
+        }
+        this.offsetsDirty = false;
+    }
+
+    // Index of the item containing vertical position y
+    indexAt(y) {
+        let low = 0;
+        let high = this.count;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (this.offsets[mid + 1] <= y) low = mid + 1;
+            else high = mid;
+        }
+        return Math.min(low, Math.max(this.count - 1, 0));
+    }
+
+    render(remeasure = true) {
+        // Hidden (display: none) lists have no layout; render once they are shown
+        if (!this.scrollElement.offsetParent) return;
+        this.computeOffsets();
+
+        const scrollRect = this.scrollElement.getBoundingClientRect();
+        const containerTop = this.container.getBoundingClientRect().top - scrollRect.top + this.scrollElement.scrollTop;
+        const viewTop = this.scrollElement.scrollTop - containerTop - this.overscan;
+        const viewBottom = viewTop + this.scrollElement.clientHeight + 2 * this.overscan;
+
+        const start = this.count ? this.indexAt(Math.max(viewTop, 0)) : 0;
+        const end = this.count ? this.indexAt(Math.max(viewBottom, 0)) + 1 : 0;
+
+        let html = '';
+        const before = this.offsets[start];
+        const after = this.offsets[this.count] - this.offsets[end];
+        if (before > 0) html += this.spacer(before);
+        for (let i = start; i < end; i++) html += this.renderItem(i);
+        if (after > 0) html += this.spacer(after);
+        this.container.innerHTML = html;
+
+        if (remeasure && this.measure()) {
+            // Measured heights differed from estimates: lay out once more
+            this.render(false);
+        }
+    }
+
+    measure() {
+        const measured = new Map();
+        this.container.querySelectorAll('[data-vindex]').forEach(el => {
+            const index = Number(el.dataset.vindex);
+            const style = getComputedStyle(el);
+            const height = el.offsetHeight + parseFloat(style.marginTop) + parseFloat(style.marginBottom);
+            measured.set(index, (measured.get(index) || 0) + height);
+        });
+
+        let changed = false;
+        measured.forEach((height, index) => {
+            if (this.heights.get(index) !== height) {
+                this.heights.set(index, height);
+                changed = true;
+            }
+        });
+        if (changed) this.offsetsDirty = true;
+        return changed;
+    }
+}
+
 async function loadConfig() {
     try {
         const response = await fetch('/api/config');
@@ -26,48 +178,64 @@ async function loadEndpoints() {
     try {
         const response = await fetch('/api/endpoints');
         endpoints = await response.json();
+        buildSearchIndex();
         renderEndpointList();
     } catch (error) {
         console.error('Failed to load endpoints:', error);
     }
 }
 
-function renderEndpointList() {
-    const list = document.getElementById('endpoint-list');
-    list.innerHTML = endpoints.map((ep, index) => `
-        <div class="endpoint-item" onclick="selectEndpoint(${index})">
+// Lowercased "METHOD path description" per endpoint, built once per load
+function buildSearchIndex() {
+    endpointSearchIndex = endpoints.map(ep =>
+        `${ep.method} ${ep.path} ${ep.description || ''}`.toLowerCase()
+    );
+    filteredEndpointIndices = endpoints.map((_, index) => index);
+}
+
+function filterEndpoints(query) {
+    // Nothing to filter until the endpoints have loaded
+    if (!endpointList) return;
+
+    const terms = query.toLowerCase().split(/\s+/).filter(Boolean);
+    filteredEndpointIndices = [];
+    for (let i = 0; i < endpointSearchIndex.length; i++) {
+        const text = endpointSearchIndex[i];
+        if (terms.every(term => text.includes(term))) {
+            filteredEndpointIndices.push(i);
+        }
+    }
+    endpointList.scrollElement.scrollTop = 0;
+    endpointList.setCount(filteredEndpointIndices.length);
+}
+
+function renderEndpointItem(position) {
+    const index = filteredEndpointIndices[position];
+    const ep = endpoints[index];
+    return `
+        <div class="endpoint-item${index === selectedEndpointIndex ? ' active' : ''}" data-vindex="${position}" onclick="selectEndpoint(${index})">
             <div class="endpoint-info">
-                <span class="method ${ep.method}">${ep.method}</span>
-                <span class="path">${ep.path}</span>
+                <span class="method ${escapeHtml(ep.method)}">${escapeHtml(ep.method)}</span>
+                <span class="path">${escapeHtml(ep.path)}</span>
             </div>
             <button class="btn-sm btn-secondary debug-btn" onclick="openDebugger(event, ${index})" title="Debug this endpoint">
                 Debug
             </button>
         </div>
-    `).join('');
+    `;
 }
 
-window.selectEndpoint = (index) => {
-    currentEndpoint = endpoints[index];
-
-    // Update active state in list
-    document.querySelectorAll('.endpoint-item').forEach((el, i) => {
-        el.classList.toggle('active', i === index);
-    });
-
-    renderRequestPanel();
-    document.getElementById('send-btn').disabled = false;
-};
-
-window.openDebugger = (event, index) => {
-    event.stopPropagation(); // Prevent triggering selectEndpoint twice (though selectEndpoint is called below)
-
-    // Select the endpoint
-    selectEndpoint(index);
-
-    // Switch to Debugger tab
-    document.querySelector('.nav-tab[data-target="debugger-view"]').click();
-};
+function renderEndpointList() {
+    if (!endpointList) {
+        endpointList = new VirtualList({
+            scrollElement: document.getElementById('endpoint-list'),
+            container: document.getElementById('endpoint-list-items'),
+            renderItem: renderEndpointItem,
+            estimatedHeight: 52
+        });
+    }
+    endpointList.reset(filteredEndpointIndices.length);
+}
 
 function renderRequestPanel() {
     const container = document.getElementById('request-config');
@@ -192,14 +360,125 @@ function updateCurlCommand() {
 
 
 // Debugger State
-let traceLog = [];
+let traceLog = null;
+let debugRunId = null; // Set while a debug run is streaming, used to cancel it
+let activeLineElement = null;
 let currentStep = 0;
 let sourceLines = [];
 let startLineOffset = 0;
 
+// Columnar trace as produced by the server (see TraceBuffer in src/server/utils.py).
+// Locals are delta encoded, so full snapshots are rebuilt on demand from the
+// nearest checkpoint instead of being stored for every step.
+const TRACE_CHECKPOINT_INTERVAL = 64;
+
+class TraceStore {
+    constructor(compact) {
+        this.strings = [];
+        this.lines = [];
+        this.functions = [];
+        this.codes = [];
+        this.sets = [];
+        this.unsets = [];
+        this.base = new Map();
+        this.dropped = 0;
+        this.checkpoints = new Map();
+
+        if (compact) {
+            this.strings = compact.strings;
+            this.lines = compact.line;
+            this.functions = compact.function;
+            this.codes = compact.code;
+            this.sets = compact.set;
+            this.unsets = compact.unset;
+            this.base = new Map(compact.base);
+            this.dropped = compact.dropped || 0;
+        }
+    }
+
+    get length() {
+        return this.lines.length;
+    }
+
+    appendStep(step) {
+        this.strings.push(...step.strings);
+        this.lines.push(step.line);
+        this.functions.push(step.function);
+        this.codes.push(step.code);
+        this.sets.push(step.set);
+        this.unsets.push(step.unset);
+    }
+
+    localsAt(index) {
+        // Start from the closest checkpoint at or before index
+        let start = Math.floor(index / TRACE_CHECKPOINT_INTERVAL) * TRACE_CHECKPOINT_INTERVAL;
+        let state;
+        if (this.checkpoints.has(start)) {
+            state = new Map(this.checkpoints.get(start));
+        } else {
+            state = new Map(this.base);
+            start = 0;
+        }
+
+        for (let i = start; i <= index; i++) {
+            if (i % TRACE_CHECKPOINT_INTERVAL === 0 && !this.checkpoints.has(i)) {
+                this.checkpoints.set(i, new Map(state));
+            }
+            this.unsets[i].forEach(nameIndex => state.delete(nameIndex));
+            this.sets[i].forEach(([nameIndex, value]) => state.set(nameIndex, value));
+        }
+
+        const locals = {};
+        state.forEach((value, nameIndex) => {
+            locals[this.strings[nameIndex]] = value;
+        });
+        return locals;
+    }
+
+    step(index) {
+        return {
+            line: this.lines[index],
+            function: this.strings[this.functions[index]],
+            code: this.strings[this.codes[index]],
+            locals: this.localsAt(index)
+        };
+    }
+}
+
+// Reads a text/event-stream response body and calls onEvent(name, data) per event
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let eventName = 'message';
+            let data = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) eventName = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            });
+            onEvent(eventName, data ? JSON.parse(data) : null);
+        }
+    }
+}
+
 function setupEventListeners() {
     document.getElementById('send-btn').addEventListener('click', sendRequest);
 
+    const filterInput = document.getElementById('endpoint-filter');
+    const debouncedFilter = debounce(() => filterEndpoints(filterInput.value), FILTER_DEBOUNCE_MS);
+    filterInput.addEventListener('input', debouncedFilter);
+
     document.getElementById('copy-curl-btn').addEventListener('click', () => {
         if (currentEndpoint) {
             navigator.clipboard.writeText(currentEndpoint.curl);
@@ -253,9 +532,15 @@ function setupEventListeners() {
     });
 
     // Debugger Controls
-    document.getElementById('start-debug-btn').addEventListener('click', startDebug);
+    document.getElementById('start-debug-btn').addEventListener('click', () => {
+        if (debugRunId) {
+            cancelDebug();
+        } else {
+            startDebug();
+        }
+    });
     document.getElementById('step-next-btn').addEventListener('click', () => {
-        if (currentStep < traceLog.length - 1) {
+        if (traceLog && currentStep < traceLog.length - 1) {
             currentStep++;
             showTraceStep(currentStep);
         }
@@ -273,9 +558,8 @@ window.selectEndpoint = (index) => {
         currentEndpoint = endpoints[index];
 
         // Update active state in list
-        document.querySelectorAll('.endpoint-item').forEach((el, i) => {
-            el.classList.toggle('active', i === index);
-        });
+        selectedEndpointIndex = index;
+        endpointList.refresh();
 
         renderRequestPanel();
         document.getElementById('send-btn').disabled = false;
@@ -358,7 +642,7 @@ async function startDebug() {
 
     const btn = document.getElementById('start-debug-btn');
     btn.disabled = true;
-    btn.textContent = 'Debugging...';
+    btn.textContent = 'Starting...';
 
     try {
         // Reuse logic to build request body from Manual view inputs
@@ -379,57 +663,99 @@ async function startDebug() {
             }
         }
 
-        const response = await fetch('/api/proxy', {
+        // The debug endpoints live on the wrapper itself, so stream directly
+        // instead of going through /api/proxy (which buffers the whole response)
+        // Path and query parameters also come from the Manual view inputs
+        const pathParams = {};
+        const query = {};
+        document.querySelectorAll('.param-input[data-in]').forEach(input => {
+            if (!input.value) return;
+            if (input.dataset.in === 'path') {
+                pathParams[input.dataset.name] = input.value;
+            } else if (input.dataset.in === 'query') {
+                query[input.dataset.name] = input.value;
+            }
+        });
+
+        const response = await fetch('/debug/stream', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
-                method: 'POST', // Debug endpoint is POST
-                url: `${serverUrl}/debug`,
-                headers: { 'Content-Type': 'application/json' },
-                body: {
-                    path: currentEndpoint.path,
-                    method: currentEndpoint.method,
-                    body: body
-                }
+                path: currentEndpoint.path,
+                method: currentEndpoint.method,
+                path_params: pathParams,
+                query: query,
+                body: currentEndpoint.body ? body : null
             })
         });
 
-        const result = await response.json();
-
-        if (result.data && result.data.trace) {
-            traceLog = result.data.trace;
-            const sourceCode = result.data.source;
-            startLineOffset = result.data.start_line;
-
-            renderSourceCode(sourceCode);
+        if (!response.ok) {
+            const result = await response.json();
+            alert(`Debug Error: ${result.error || response.status}`);
+            return;
+        }
 
-            if (traceLog.length > 0) {
-                currentStep = 0;
-                showTraceStep(0);
+        traceLog = new TraceStore();
+        currentStep = 0;
 
-                document.getElementById('step-prev-btn').disabled = false;
-                document.getElementById('step-next-btn').disabled = false;
-            } else {
-                alert("No trace captured. Function might be empty or not traced.");
+        await readEventStream(response, (event, data) => {
+            if (event === 'source') {
+                // The run is in progress: let the same button cancel it
+                debugRunId = data.id;
+                btn.disabled = false;
+                btn.textContent = 'Cancel Debug';
+                startLineOffset = data.start_line;
+                renderSourceCode(data.source);
+            } else if (event === 'step') {
+                traceLog.appendStep(data);
+                // Show the first step as soon as it arrives, then only refresh the counter
+                if (traceLog.length === 1) {
+                    showTraceStep(0);
+                } else {
+                    scheduleStepControlsUpdate();
+                }
+            } else if (event === 'done') {
+                if (traceLog.length === 0 && data.status >= 400) {
+                    // Rejected before reaching the endpoint (e.g. validation or a dependency)
+                    alert(`Request failed with status ${data.status}:\n${JSON.stringify(data.result, null, 2)}`);
+                } else if (traceLog.length === 0) {
+                    alert("No trace captured. Function might be empty or not traced.");
+                }
+            } else if (event === 'error') {
+                alert(`Debug Error: ${data.error}`);
             }
-        } else if (result.error) {
-            alert(`Debug Error: ${result.error}`);
-        } else if (result.data && result.data.error) {
-            alert(`Debug Error: ${result.data.error}`);
-        }
+        });
 
     } catch (error) {
         console.error(error);
         alert("Failed to start debugger");
     } finally {
+        debugRunId = null;
         btn.disabled = false;
         btn.textContent = 'Start Debug';
     }
 }
 
+async function cancelDebug() {
+    const btn = document.getElementById('start-debug-btn');
+    btn.disabled = true;
+    btn.textContent = 'Cancelling...';
+
+    try {
+        await fetch('/debug/cancel', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ id: debugRunId })
+        });
+    } catch (error) {
+        console.error('Failed to cancel debug run:', error);
+    }
+}
+
 function renderSourceCode(code) {
     const container = document.querySelector('.code-container pre');
     container.innerHTML = ''; // Clear
+    activeLineElement = null;
 
     sourceLines = code.split('\n');
 
@@ -449,18 +775,33 @@ function renderSourceCode(code) {
     container.style.counterReset = `line ${startLineOffset - 1}`;
 }
 
-function showTraceStep(index) {
-    const step = traceLog[index];
+// Steps can arrive faster than the browser paints; refresh the counter once per frame
+let stepControlsFrame = null;
 
-    // Update Counter
+function scheduleStepControlsUpdate() {
+    if (stepControlsFrame === null) {
+        stepControlsFrame = requestAnimationFrame(() => {
+            stepControlsFrame = null;
+            updateStepControls(currentStep);
+        });
+    }
+}
+
+function updateStepControls(index) {
     document.getElementById('step-counter').textContent = `Step ${index + 1} / ${traceLog.length}`;
+    document.getElementById('step-prev-btn').disabled = index === 0;
+    document.getElementById('step-next-btn').disabled = index === traceLog.length - 1;
+}
 
-    // Highlight Line
-    document.querySelectorAll('.code-line').forEach(el => el.classList.remove('active-line'));
-    const activeLine = document.getElementById(`code-line-${step.line}`);
-    if (activeLine) {
-        activeLine.classList.add('active-line');
-        activeLine.scrollIntoView({ behavior: 'smooth', block: 'center' });
+function showTraceStep(index) {
+    const step = traceLog.step(index);
+
+    // Highlight Line (only the previously active line needs clearing)
+    if (activeLineElement) activeLineElement.classList.remove('active-line');
+    activeLineElement = document.getElementById(`code-line-${step.line}`);
+    if (activeLineElement) {
+        activeLineElement.classList.add('active-line');
+        activeLineElement.scrollIntoView({ behavior: 'smooth', block: 'center' });
     }
 
     // Update Variables
@@ -469,168 +810,172 @@ function showTraceStep(index) {
 
     if (step.locals) {
         for (const [name, value] of Object.entries(step.locals)) {
-            let displayValue = value;
+            let displayValue = escapeHtml(value);
             if (typeof value === 'object' && value !== null) {
-                displayValue = `<pre style="margin: 0; white-space: pre-wrap;">${JSON.stringify(value, null, 2)}</pre>`;
+                displayValue = `<pre style="margin: 0; white-space: pre-wrap;">${escapeHtml(JSON.stringify(value, null, 2))}</pre>`;
             } else if (typeof value === 'string') {
-                displayValue = `"${value}"`;
+                displayValue = `"${escapeHtml(value)}"`;
             }
 
             const row = document.createElement('tr');
             row.innerHTML = `
-                <td style="vertical-align: top; font-family: var(--font-mono); color: var(--accent-color);">${name}</td>
+                <td style="vertical-align: top; font-family: var(--font-mono); color: var(--accent-color);">${escapeHtml(name)}</td>
                 <td style="font-family: var(--font-mono);">${displayValue}</td>
             `;
             varsBody.appendChild(row);
         }
     }
 
-    // Update Buttons
-    document.getElementById('step-prev-btn').disabled = index === 0;
-    document.getElementById('step-next-btn').disabled = index === traceLog.length - 1;
+    updateStepControls(index);
 }
 
-async function runAllTests() {
-    const tbody = document.getElementById('results-body');
-    const statsDiv = document.getElementById('runner-stats');
+// Auto Runner: the virtualized results table
+let resultsList = null;
+let testRunToken = 0;
 
-    tbody.innerHTML = '';
-    statsDiv.style.display = 'flex';
-    testResults = []; // Clear previous results
+function renderTestResult(i) {
+    const result = testResults[i];
+    const ep = result.endpoint;
+    const badge = result.success ? 'status-success' : 'status-error';
 
-    let stats = { total: endpoints.length, passed: 0, failed: 0 };
-    updateStats(stats);
+    let html = `
+        <tr class="test-row${result.expanded ? ' expanded' : ''}" data-vindex="${i}" onclick="toggleTestDetails(${i})">
+            <td><span class="method ${escapeHtml(ep.method)}">${escapeHtml(ep.method)}</span></td>
+            <td style="font-family: var(--font-mono);">${escapeHtml(ep.path)}</td>
+            <td><span class="status-badge-cell ${badge}">${escapeHtml(result.status)}</span></td>
+            <td>${result.time}ms</td>
+            <td>
+                <span style="margin-right: 0.5rem;">${result.success ? 'Pass' : 'Fail'}</span>
+                <span class="expand-icon" style="transform: rotate(${result.expanded ? 180 : 0}deg);">▼</span>
+            </td>
+        </tr>
+    `;
 
-    for (let i = 0; i < endpoints.length; i++) {
-        const ep = endpoints[i];
-        const startTime = performance.now();
-        let status = 'Pending';
-        let statusCode = '-';
-        let isSuccess = false;
-        let responseData = null;
-
-        try {
-            // Construct URL with default values
-            let url = `${serverUrl}${ep.path}`;
-            const queryParams = new URLSearchParams();
-
-            if (ep.parameters) {
-                ep.parameters.forEach(p => {
-                    if (p.in === 'path') {
-                        url = url.replace(`{${p.name}}`, '1'); // Default ID
-                    } else if (p.in === 'query') {
-                        queryParams.append(p.name, 'test'); // Default query
-                    }
-                });
-            }
+    if (result.expanded) {
+        // Response bodies are only highlighted for rows that are actually open
+        const responseContent = typeof result.response === 'object' && result.response !== null
+            ? syntaxHighlight(JSON.stringify(result.response, null, 2))
+            : escapeHtml(result.response);
 
-            if (queryParams.toString()) {
-                url += `?${queryParams.toString()}`;
-            }
+        html += `
+            <tr class="test-details-row" data-vindex="${i}">
+                <td colspan="5">
+                    <div class="details-content">
+                        <div class="response-meta" style="margin-bottom: 0.5rem; padding: 0;">
+                            <span class="meta-item">Status: <span style="color: ${result.success ? 'var(--success)' : 'var(--error)'}">${escapeHtml(result.status)}</span></span>
+                            <span class="meta-item">Time: <span>${result.time}ms</span></span>
+                        </div>
+                        <pre>${responseContent}</pre>
+                    </div>
+                </td>
+            </tr>
+        `;
+    }
+    return html;
+}
 
-            // Construct Body
-            let body = {};
-            if (ep.body) {
-                body = ep.body.example || { "example": "test" };
-            }
+async function runTest(ep) {
+    const startTime = performance.now();
+    let statusCode = '-';
+    let isSuccess = false;
+    let responseData = null;
 
-            const response = await fetch('/api/proxy', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    method: ep.method,
-                    url: url,
-                    headers: { 'Content-Type': 'application/json' },
-                    body: body
-                })
+    try {
+        // Construct URL with default values
+        let url = `${serverUrl}${ep.path}`;
+        const queryParams = new URLSearchParams();
+
+        if (ep.parameters) {
+            ep.parameters.forEach(p => {
+                if (p.in === 'path') {
+                    url = url.replace(`{${p.name}}`, '1'); // Default ID
+                } else if (p.in === 'query') {
+                    queryParams.append(p.name, 'test'); // Default query
+                }
             });
+        }
 
-            const result = await response.json();
-            statusCode = result.status || response.status;
-            isSuccess = statusCode >= 200 && statusCode < 300;
-            responseData = result.data || result.error;
-
-        } catch (error) {
-            statusCode = 'Error';
-            isSuccess = false;
-            responseData = error.message;
+        if (queryParams.toString()) {
+            url += `?${queryParams.toString()}`;
         }
 
-        const endTime = performance.now();
-        const duration = Math.round(endTime - startTime);
-
-        // Store Result
-        testResults.push({
-            endpoint: ep,
-            status: statusCode,
-            time: duration,
-            success: isSuccess,
-            response: responseData
+        // Construct Body
+        let body = {};
+        if (ep.body) {
+            body = ep.body.example || { "example": "test" };
+        }
+
+        const response = await fetch('/api/proxy', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                method: ep.method,
+                url: url,
+                headers: { 'Content-Type': 'application/json' },
+                body: body
+            })
         });
 
-        // Update Stats
-        if (isSuccess) stats.passed++; else stats.failed++;
-        updateStats(stats);
+        const result = await response.json();
+        statusCode = result.status || response.status;
+        isSuccess = statusCode >= 200 && statusCode < 300;
+        responseData = result.data || result.error;
 
-        // Add Row
-        const rowId = `test-row-${i}`;
-        const detailsId = `test-details-${i}`;
-
-        const row = document.createElement('tr');
-        row.id = rowId;
-        row.className = 'test-row';
-        row.onclick = () => toggleTestDetails(i);
-        row.innerHTML = `
-            <td><span class="method ${ep.method}">${ep.method}</span></td>
-            <td style="font-family: var(--font-mono);">${ep.path}</td>
-            <td><span class="status-badge-cell ${isSuccess ? 'status-success' : 'status-error'}">${statusCode}</span></td>
-            <td>${duration}ms</td>
-            <td>
-                <span style="margin-right: 0.5rem;">${isSuccess ? 'Pass' : 'Fail'}</span>
-                <span class="expand-icon">▼</span>
-            </td>
-        `;
-        tbody.appendChild(row);
-
-        // Add Details Row
-        const detailsRow = document.createElement('tr');
-        detailsRow.id = detailsId;
-        detailsRow.className = 'test-details-row';
-        detailsRow.style.display = 'none';
-
-        const responseContent = typeof responseData === 'object'
-            ? syntaxHighlight(JSON.stringify(responseData, null, 2))
-            : responseData;
-
-        detailsRow.innerHTML = `
-            <td colspan="5">
-                <div class="details-content">
-                    <div class="response-meta" style="margin-bottom: 0.5rem; padding: 0;">
-                        <span class="meta-item">Status: <span style="color: ${isSuccess ? 'var(--success)' : 'var(--error)'}">${statusCode}</span></span>
-                        <span class="meta-item">Time: <span>${duration}ms</span></span>
-                    </div>
-                    <pre>${responseContent}</pre>
-                </div>
-            </td>
-        `;
-        tbody.appendChild(detailsRow);
+    } catch (error) {
+        statusCode = 'Error';
+        isSuccess = false;
+        responseData = error.message;
     }
+
+    return {
+        endpoint: ep,
+        status: statusCode,
+        time: Math.round(performance.now() - startTime),
+        success: isSuccess,
+        response: responseData,
+        expanded: false
+    };
 }
 
-window.toggleTestDetails = (index) => {
-    const detailsRow = document.getElementById(`test-details-${index}`);
-    const row = document.getElementById(`test-row-${index}`);
-    const icon = row.querySelector('.expand-icon');
-
-    if (detailsRow.style.display === 'none') {
-        detailsRow.style.display = 'table-row';
-        row.classList.add('expanded');
-        icon.style.transform = 'rotate(180deg)';
-    } else {
-        detailsRow.style.display = 'none';
-        row.classList.remove('expanded');
-        icon.style.transform = 'rotate(0deg)';
+async function runAllTests() {
+    const statsDiv = document.getElementById('runner-stats');
+
+    if (!resultsList) {
+        resultsList = new VirtualList({
+            scrollElement: document.querySelector('.runner-content'),
+            container: document.getElementById('results-body'),
+            renderItem: renderTestResult,
+            estimatedHeight: 45,
+            spacer: height => `<tr style="height: ${height}px"><td colspan="5" style="padding: 0; border: none;"></td></tr>`
+        });
     }
+
+    // Results from a previous, still running batch are ignored
+    const token = ++testRunToken;
+    statsDiv.style.display = 'flex';
+    testResults = []; // Clear previous results
+    resultsList.reset(0);
+
+    let stats = { total: endpoints.length, passed: 0, failed: 0 };
+    updateStats(stats);
+
+    // One request at a time, in endpoint order: later endpoints may depend on
+    // earlier ones (create then read/update/delete) and timings stay uncontended
+    for (const ep of endpoints) {
+        const result = await runTest(ep);
+        if (token !== testRunToken) return;
+
+        // Append only; the table re-renders at most once per frame
+        testResults.push(result);
+        if (result.success) stats.passed++; else stats.failed++;
+        updateStats(stats);
+        resultsList.setCount(testResults.length);
+    }
+}
+
+window.toggleTestDetails = (index) => {
+    testResults[index].expanded = !testResults[index].expanded;
+    resultsList.invalidate(index);
 };
 
 function updateStats(stats) {
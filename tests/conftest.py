@@ -0,0 +1,85 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+USER_APP = '''
+import asyncio
+import contextvars
+import time
+
+from fastapi import Depends, FastAPI
+
+app = FastAPI()
+current_user = contextvars.ContextVar("current_user", default=None)
+
+
+async def set_current_user():
+    current_user.set("alice")
+
+
+@app.get("/ping")
+def ping():
+    return {"ok": True}
+
+
+@app.get("/items/{item_id}")
+def read_item(item_id: str):
+    return {"item_id": item_id}
+
+
+@app.get("/files/{file_path:path}")
+def read_file(file_path: str):
+    return {"file_path": file_path}
+
+
+@app.get("/whoami", dependencies=[Depends(set_current_user)])
+def whoami():
+    return {"user": current_user.get()}
+
+
+@app.get("/spin")
+def spin():
+    count = 0
+    while True:
+        try:
+            count += 1
+            time.sleep(0.01)
+        except Exception:
+            pass
+
+
+@app.get("/spin-async")
+async def spin_async():
+    count = 0
+    while True:
+        try:
+            count += 1
+            await asyncio.sleep(0.01)
+        except Exception:
+            pass
+'''
+
+
+@pytest.fixture(scope="session")
+def wrapper(tmp_path_factory):
+    """Imports the wrapper around a throwaway user app, with the proxy cache enabled"""
+    work_dir = tmp_path_factory.mktemp("wrapper")
+    app_file = work_dir / "wrapper_test_app.py"
+    app_file.write_text(USER_APP)
+    config_file = work_dir / "config.json"
+    config_file.write_text(json.dumps({
+        "app": {"host": "127.0.0.1", "port": 3020},
+        "pythonServerFile": str(app_file),
+        "endpointsOutputFile": str(work_dir / "endpoints.json"),
+        "proxyCache": {"enabled": True},
+    }))
+
+    patch = pytest.MonkeyPatch()
+    patch.setenv("API_TESTER_CONFIG", str(config_file))
+    sys.modules.pop("src.server.wrapper", None)
+    module = importlib.import_module("src.server.wrapper")
+    yield module
+    sys.modules.pop("src.server.wrapper", None)
+    patch.undo()
@@ -0,0 +1,57 @@
+import random
+from statistics import median
+
+from src.runner.benchmark import mann_whitney_greater, bootstrap_ratio_ci, compare
+
+
+def noisy(center, n=40, seed=0):
+    rng = random.Random(seed)
+    return [center * rng.uniform(0.95, 1.05) for _ in range(n)]
+
+
+def test_mann_whitney_detects_a_clear_shift():
+    assert mann_whitney_greater(noisy(12), noisy(10, seed=1)) < 0.001
+    assert mann_whitney_greater(noisy(10), noisy(12, seed=1)) > 0.999
+
+
+def test_mann_whitney_identical_samples():
+    assert mann_whitney_greater([5.0] * 10, [5.0] * 10) == 1.0
+    assert mann_whitney_greater([], [1.0]) == 1.0
+
+
+def test_bootstrap_ratio_ci_brackets_the_median_ratio():
+    current, baseline = noisy(15), noisy(10, seed=1)
+    low, high = bootstrap_ratio_ci(current, baseline)
+    assert low <= median(current) / median(baseline) <= high
+    assert 1.4 < low and high < 1.65
+
+
+def test_compare_statuses():
+    baseline = {"GET /a": noisy(10), "GET /b": noisy(10), "GET /gone": noisy(10)}
+    current = {"GET /a": noisy(20, seed=1), "GET /b": noisy(10, seed=1), "GET /new": noisy(10, seed=1)}
+    rows = {row["endpoint"]: row for row in compare(current, baseline)}
+
+    assert rows["GET /a"]["status"] == "regression"
+    assert rows["GET /b"]["status"] == "unchanged"
+    assert rows["GET /new"]["status"] == "new"
+    assert rows["GET /gone"]["status"] == "missing"
+
+
+def test_fast_error_is_not_an_improvement():
+    baseline = {"GET /a": noisy(10)}
+    current = {"GET /a": noisy(2, seed=1)}
+    ok = {"GET /a": [200] * 40}
+    failing = {"GET /a": [500] * 39 + [None]}
+
+    row = compare(current, baseline, current_statuses=failing, baseline_statuses=ok)[0]
+    assert row["status"] == "broken"
+    assert row["statuses"] == {"500": 39, "error": 1}
+
+    row = compare(current, baseline, current_statuses=failing)[0]
+    assert row["status"] == "broken"
+
+    row = compare(current, baseline, current_statuses=failing, baseline_statuses=failing)[0]
+    assert row["status"] == "error"
+
+    row = compare(current, baseline, current_statuses=ok, baseline_statuses=failing)[0]
+    assert row["status"] == "recovered"
@@ -0,0 +1,98 @@
+import pytest
+
+from src.server import cache as cache_module
+from src.server.cache import ResponseCache, parse_cache_control
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def store(cache, url, size=10, status=200, cache_control=None, method="GET"):
+    headers = {"cache-control": cache_control} if cache_control else {}
+    key = cache.key(method, url, {})
+    return key, cache.put(key, status, headers, {"url": url}, size)
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=30, no-cache, private="x"') == {"max-age": "30", "no-cache": True, "private": "x"}
+    assert parse_cache_control(None) == {}
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl=60)
+    key, _ = store(cache, "http://api/a")
+    clock[0] += 59
+    assert cache.get(key) == {"url": "http://api/a"}
+    clock[0] += 2
+    assert cache.get(key) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_max_age_shortens_ttl(clock):
+    cache = ResponseCache(ttl=60)
+    key, _ = store(cache, "http://api/a", cache_control="max-age=5")
+    clock[0] += 6
+    assert cache.get(key) is None
+
+
+def test_uncacheable_responses_are_not_stored():
+    cache = ResponseCache()
+    assert store(cache, "http://api/a", cache_control="no-store")[1] is False
+    assert store(cache, "http://api/b", cache_control="private")[1] is False
+    assert store(cache, "http://api/c", cache_control="max-age=0")[1] is False
+    assert store(cache, "http://api/d", status=500)[1] is False
+    assert store(cache, "http://api/e", cache_control="public, max-age=30")[1] is True
+    assert cache.stats()["entries"] == 1
+
+
+def test_lru_eviction_by_count():
+    cache = ResponseCache(max_entries=2)
+    a, _ = store(cache, "http://api/a")
+    b, _ = store(cache, "http://api/b")
+    cache.get(a)
+    c, _ = store(cache, "http://api/c")
+    assert cache.get(b) is None
+    assert cache.get(a) is not None and cache.get(c) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=100)
+    a, _ = store(cache, "http://api/a", size=60)
+    b, _ = store(cache, "http://api/b", size=60)
+    assert cache.get(a) is None and cache.get(b) is not None
+    assert cache.stats()["bytes"] == 60
+    assert store(cache, "http://api/huge", size=101)[1] is False
+
+
+def test_bypass_requests():
+    cache = ResponseCache()
+    assert cache.should_bypass({"X-Proxy-Cache-Bypass": "1"})
+    assert cache.should_bypass({"Cache-Control": "no-cache"})
+    assert not cache.should_bypass({"Accept": "application/json"})
+
+
+def test_vary_headers_are_part_of_the_key():
+    cache = ResponseCache()
+    assert cache.key("GET", "http://api/a", {"Accept": "text/html"}) != cache.key("get", "http://api/a", {"accept": "application/json"})
+    assert cache.key("GET", "http://api/a", {"X-Other": "1"}) == cache.key("GET", "http://api/a", {})
+
+
+def test_unsafe_methods_invalidate_the_resource():
+    cache = ResponseCache()
+    get, _ = store(cache, "http://api/items/1")
+    head, _ = store(cache, "http://api/items/1?q=x", method="HEAD")
+    other, _ = store(cache, "http://api/items/2")
+
+    assert cache.invalidates("PUT", 200) and cache.invalidates("delete", 204)
+    assert not cache.invalidates("PUT", 404)
+    assert not cache.invalidates("GET", 200)
+
+    assert cache.invalidate("http://api/items/1?notify=1") == 2
+    assert cache.get(get) is None and cache.get(head) is None
+    assert cache.get(other) is not None
+    assert cache.stats()["invalidations"] == 2
@@ -0,0 +1,89 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_fill_path_params_encodes_values(wrapper):
+    path, raw_path = wrapper._fill_path_params("/items/{item_id}", {"item_id": "a b?c#d/e"})
+    assert path == "/items/a b?c#d/e"
+    assert raw_path == b"/items/a%20b%3Fc%23d%2Fe"
+
+
+def test_fill_path_params_keeps_slashes_for_path_converter(wrapper):
+    path, raw_path = wrapper._fill_path_params("/files/{file_path:path}", {"file_path": "dir/a b.txt"})
+    assert path == "/files/dir/a b.txt"
+    assert raw_path == b"/files/dir/a%20b.txt"
+
+
+def test_fill_path_params_requires_every_param(wrapper):
+    with pytest.raises(ValueError):
+        wrapper._fill_path_params("/items/{item_id}", {})
+
+
+def test_debug_reaches_the_route_with_special_characters(wrapper):
+    client = TestClient(wrapper.app)
+    result = client.post("/debug", json={"path": "/items/{item_id}", "method": "GET", "path_params": {"item_id": "a b?c#d"}}).json()
+    assert result["status"] == 200
+    assert result["result"] == {"item_id": "a b?c#d"}
+
+    result = client.post("/debug", json={"path": "/files/{file_path:path}", "method": "GET", "path_params": {"file_path": "dir/a b.txt"}}).json()
+    assert result["result"] == {"file_path": "dir/a b.txt"}
+
+
+
+@pytest.fixture
+def tracers(wrapper, monkeypatch, tmp_path):
+    """Records the Tracer of every debug run"""
+    created = []
+
+    class RecordingTracer(wrapper.Tracer):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(wrapper, "Tracer", RecordingTracer)
+    return created
+
+
+def assert_stopped(tracer):
+    steps = len(tracer.trace_log)
+    time.sleep(0.1)
+    assert len(tracer.trace_log) == steps
+
+
+@pytest.mark.parametrize("path", ["/spin", "/spin-async"])
+def test_cancel_stops_the_run(wrapper, tracers, path):
+    with TestClient(wrapper.app) as client, ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(client.post, "/debug", json={"path": path, "method": "GET", "id": "run-1"})
+        deadline = time.monotonic() + 5
+        while not (tracers and len(tracers[0].trace_log) > 5):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        assert client.post("/debug/cancel", json={"id": "run-1"}).json() == {"cancelled": True}
+        result = pending.result(timeout=5).json()
+        assert result["cancelled"] is True
+        assert_stopped(tracers[0])
+
+        # The event loop is left untraced: later requests are unaffected
+        result = client.post("/debug", json={"path": "/ping", "method": "GET"}).json()
+        assert result["status"] == 200
+        assert result["result"] == {"ok": True}
+
+
+@pytest.mark.parametrize("path", ["/spin", "/spin-async"])
+def test_timeout_stops_the_run(wrapper, tracers, monkeypatch, path):
+    monkeypatch.setattr(wrapper, "DEBUG_TIMEOUT_SECONDS", 0.2)
+    with TestClient(wrapper.app) as client:
+        result = client.post("/debug", json={"path": path, "method": "GET"}).json()
+        assert "exceeded 0.2s" in result["error"]
+        assert_stopped(tracers[0])
+        assert client.post("/debug", json={"path": "/ping", "method": "GET"}).json()["status"] == 200
+
+
+def test_sync_handler_sees_context_vars_from_dependencies(wrapper):
+    result = TestClient(wrapper.app).post("/debug", json={"path": "/whoami", "method": "GET"}).json()
+    assert result["result"] == {"user": "alice"}
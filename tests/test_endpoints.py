@@ -0,0 +1,76 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.generator import endpoints as endpoints_module
+from src.generator.endpoints import ensure_endpoints_file
+
+SERVER = '''
+from fastapi import FastAPI
+
+app = FastAPI()
+
+
+@app.get("/ping")
+def ping():
+    return {"ok": True}
+'''
+
+
+def write_config(path, port, server_file, output_file):
+    config = {
+        "app": {"port": port},
+        "pythonServerFile": str(server_file),
+        "endpointsOutputFile": str(output_file),
+        "autoGenerateEndpoints": True,
+    }
+    path.write_text(json.dumps(config))
+    return config
+
+
+def test_regenerates_after_config_change(tmp_path):
+    server_file = tmp_path / "server.py"
+    server_file.write_text(SERVER)
+    output_file = tmp_path / "endpoints.json"
+    config_file = tmp_path / "config.json"
+
+    config = write_config(config_file, 3020, server_file, output_file)
+    ensure_endpoints_file(config, str(tmp_path), str(config_file))
+    assert "localhost:3020/ping" in json.loads(output_file.read_text())[0]["curl"]
+
+    # Unchanged inputs: the file is reused
+    generated_at = os.path.getmtime(output_file)
+    os.utime(output_file, (generated_at + 10, generated_at + 10))
+    ensure_endpoints_file(config, str(tmp_path), str(config_file))
+    assert os.path.getmtime(output_file) == generated_at + 10
+
+    config = write_config(config_file, 4040, server_file, output_file)
+    os.utime(config_file, (generated_at + 20, generated_at + 20))
+    ensure_endpoints_file(config, str(tmp_path), str(config_file))
+    assert "localhost:4040/ping" in json.loads(output_file.read_text())[0]["curl"]
+
+
+def test_concurrent_first_requests_generate_once(tmp_path, monkeypatch):
+    server_file = tmp_path / "server.py"
+    server_file.write_text(SERVER)
+    output_file = tmp_path / "endpoints.json"
+    config_file = tmp_path / "config.json"
+    config = write_config(config_file, 3020, server_file, output_file)
+
+    calls = []
+    parse = endpoints_module.parse_fastapi_file
+
+    def slow_parse(*args):
+        calls.append(args)
+        time.sleep(0.05)
+        return parse(*args)
+
+    monkeypatch.setattr(endpoints_module, "parse_fastapi_file", slow_parse)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = list(pool.map(lambda _: ensure_endpoints_file(config, str(tmp_path), str(config_file)), range(8)))
+
+    assert len(calls) == 1
+    assert set(paths) == {str(output_file)}
+    assert json.loads(output_file.read_text())[0]["path"] == "/ping"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".endpoints-")] == []
@@ -0,0 +1,49 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.runner.fuzz import generate_cases, _build_url, MAX_QUERY_VALUE_BYTES
+
+
+def size_cases(endpoint):
+    return {c["size_class"]: c for c in generate_cases(endpoint) if c["kind"] == "size"}
+
+
+def test_query_params_are_capped_and_not_repeated():
+    endpoint = {"method": "GET", "path": "/search", "parameters": [{"name": "q", "type": "str", "in": "query"}]}
+    cases = size_cases(endpoint)
+    assert set(cases) == {"small", "medium"}
+    assert len(cases["small"]["params"]["q"]) == 16
+    assert len(cases["medium"]["params"]["q"]) == MAX_QUERY_VALUE_BYTES
+
+
+def test_body_fields_grow_to_every_size_class():
+    endpoint = {
+        "method": "POST",
+        "path": "/notes",
+        "parameters": [{"name": "tag", "type": "str", "in": "query"}],
+        "body": {"example": {"text": "hi"}, "schema": [{"name": "text", "type": "str", "required": True}]},
+    }
+    cases = size_cases(endpoint)
+    assert set(cases) == {"small", "medium", "large"}
+    assert len(cases["large"]["body"]["text"]) == 512 * 1024
+    assert all(len(c["params"]["tag"]) <= MAX_QUERY_VALUE_BYTES for c in cases.values())
+
+
+def test_path_values_are_percent_encoded():
+    endpoint = {"method": "GET", "path": "/users/{name}", "parameters": [{"name": "name", "type": "str", "in": "path"}]}
+    url, query = _build_url("http://api/", endpoint, {"name": "a/b c?\x00"})
+    assert url == "http://api/users/a%2Fb%20c%3F%00"
+    assert query == {}
+
+
+def test_empty_string_is_not_used_for_path_params():
+    endpoint = {"method": "GET", "path": "/users/{name}", "parameters": [{"name": "name", "type": "str", "in": "path"}]}
+    values = [c["params"]["name"] for c in generate_cases(endpoint) if c["kind"] == "boundary"]
+    assert "" not in values and " " in values
+
+
+@pytest.mark.parametrize("body", [{"concurrency": 0}, {"repeat": 0}, {"concurrency": "8"}, {"repeat": True}])
+def test_fuzz_rejects_invalid_settings(wrapper, body):
+    response = TestClient(wrapper.app).post("/api/fuzz", json=body)
+    assert response.status_code == 400
+    assert "positive integer" in response.json()["error"]
@@ -0,0 +1,43 @@
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def upstream(wrapper, monkeypatch):
+    """Routes the proxy's outgoing requests to an in-memory upstream"""
+    state = {"value": 1, "requests": []}
+
+    def handler(request):
+        state["requests"].append(request.method)
+        if request.method == "PUT":
+            state["value"] += 1
+        body = b"" if request.method == "HEAD" else json.dumps({"value": state["value"]}).encode()
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=body)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+    wrapper.proxy_cache.clear()
+    return state
+
+
+def proxy(client, method, url="http://upstream/items/1"):
+    response = client.post("/api/proxy", json={"method": method, "url": url, "headers": {}})
+    return response.status_code, response.headers.get("x-proxy-cache"), response.json()["data"]
+
+
+def test_head_with_json_content_type(wrapper, upstream):
+    client = TestClient(wrapper.app)
+    assert proxy(client, "HEAD") == (200, "MISS", None)
+    assert proxy(client, "HEAD") == (200, "HIT", None)
+
+
+def test_unsafe_method_invalidates_cached_get(wrapper, upstream):
+    client = TestClient(wrapper.app)
+    assert proxy(client, "GET") == (200, "MISS", {"value": 1})
+    assert proxy(client, "GET") == (200, "HIT", {"value": 1})
+    assert proxy(client, "PUT") == (200, "UNCACHEABLE", {"value": 2})
+    assert proxy(client, "GET") == (200, "MISS", {"value": 2})
+    assert upstream["requests"] == ["GET", "PUT", "GET"]
@@ -0,0 +1,92 @@
+from src.server.utils import TraceBuffer, Tracer, coalesce_steps
+
+
+def replay(steps):
+    """Applies compact steps the way the UI does and returns the final locals"""
+    strings = []
+    state = {}
+    for step in steps:
+        strings.extend(step["strings"])
+        for name_index in step["unset"]:
+            state.pop(name_index, None)
+        for name_index, value in step["set"]:
+            state[name_index] = value
+    return {strings[k]: v for k, v in state.items()}
+
+
+def test_only_changed_locals_are_recorded():
+    buffer = TraceBuffer()
+    buffer.append(1, "f", "a = 1", {"a": 1})
+    step = buffer.append(2, "f", "b = 2", {"a": 1, "b": 2})
+    assert step["set"] == [[buffer.strings.index("b"), 2]]
+    step = buffer.append(3, "f", "del a", {"b": 2})
+    assert step["unset"] == [buffer.strings.index("a")]
+
+
+def test_type_change_with_equal_value_is_a_delta():
+    buffer = TraceBuffer()
+    buffer.append(1, "f", "x = 1", {"x": 1})
+    assert buffer.append(2, "f", "x = True", {"x": True})["set"] != []
+    assert buffer.append(3, "f", "x = 1.0", {"x": 1.0})["set"] != []
+    assert buffer.append(4, "f", "pass", {"x": 1.0})["set"] == []
+    assert buffer.expand()[1]["locals"]["x"] is True
+
+
+def test_strings_are_interned_once():
+    buffer = TraceBuffer()
+    first = buffer.append(1, "f", "x = 1", {"x": 1})
+    second = buffer.append(1, "f", "x = 1", {"x": 2})
+    assert first["strings"] == ["f", "x = 1", "x"]
+    assert second["strings"] == []
+
+
+def test_eviction_folds_oldest_steps_into_base():
+    buffer = TraceBuffer(max_steps=2)
+    buffer.append(1, "f", "a = 1", {"a": 1})
+    buffer.append(2, "f", "b = 2", {"a": 1, "b": 2})
+    buffer.append(3, "f", "del a", {"b": 2})
+    buffer.append(4, "f", "c = 3", {"b": 2, "c": 3})
+
+    assert len(buffer) == 2
+    assert buffer.dropped == 2
+    assert list(buffer.lines) == [3, 4]
+    steps = buffer.expand()
+    assert steps[0]["locals"] == {"b": 2}
+    assert steps[1]["locals"] == {"b": 2, "c": 3}
+
+
+def test_coalesced_steps_replay_to_the_same_locals():
+    buffer = TraceBuffer()
+    steps = [
+        buffer.append(1, "f", "a = 1", {"a": 1}),
+        buffer.append(2, "f", "b = 2", {"a": 1, "b": 2}),
+        buffer.append(3, "f", "del a", {"b": 2}),
+        buffer.append(4, "f", "a = 5", {"a": 5, "b": 2}),
+        buffer.append(5, "f", "del b", {"a": 5}),
+    ]
+    merged = coalesce_steps(coalesce_steps(steps[1], steps[2]), steps[3])
+
+    assert merged["line"] == 4
+    assert merged["coalesced"] == 3
+    assert replay([steps[0], merged]) == replay(steps[:4]) == {"a": 5, "b": 2}
+    assert replay([steps[0], coalesce_steps(merged, steps[4])]) == {"a": 5}
+
+
+def test_tracer_records_container_mutation_and_type_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def handler():
+        items = [1]
+        items.append(2)
+        flag = 1
+        flag = True
+        opaque = object()
+        return items, flag, opaque
+
+    tracer = Tracer()
+    tracer.run(handler)
+    steps = tracer.get_log()
+    assert [1] in [s["locals"].get("items") for s in steps]
+    assert steps[-1]["locals"]["items"] == [1, 2]
+    assert steps[-1]["locals"]["flag"] is True
+    assert steps[-1]["locals"]["opaque"].startswith("<object object")